@@ -1,169 +1,619 @@
+import heapq
+import math
+from collections import deque
+
+import numpy as np
+
+from workload import Workload
+
+
+def fcfs_columns(workload):
+    order = np.argsort(workload.arrival, kind="stable")
+    arrival = workload.arrival[order]
+    burst = workload.burst[order]
+    finished_work = np.cumsum(burst)
+    completion = finished_work + np.maximum(np.maximum.accumulate(arrival - (finished_work - burst)), 0)
+    return order, completion - burst, completion
+
+def _fcfs_workload(workload):
+    order, start_times, completion = fcfs_columns(workload)
+    names = workload.process_names()[order].tolist()
+    end_time = completion[-1] if len(completion) else 0
+    schedule = list(zip(names, workload.burst[order].tolist()))
+    timestamps = np.round(np.append(start_times, end_time), 2).tolist()
+    completion_times = dict(zip(names, completion.tolist()))
+    waiting_times = list(zip(names, (start_times - workload.arrival[order]).tolist()))
+    return schedule, timestamps, completion_times, waiting_times
+
+def _arrival_ordered(jobs):
+    last_arrival_time = float('-inf')
+    for job in jobs:
+        if job[1] < last_arrival_time:
+            raise ValueError(f"Jobs must be ordered by arrival time: {job[0]} arrives at {job[1]} after {last_arrival_time}")
+        last_arrival_time = job[1]
+        yield job
+
+
+def _fcfs_core(jobs):
+    current_time = 0
+    for job in jobs:
+        start_time = max(current_time, job[1])
+        yield job, start_time, job[2], True
+        current_time = start_time + job[2]
+
+def fcfs_segments(jobs):
+    """Lazily schedule arrival-ordered (name, arrival, burst, priority) jobs.
+
+    Yields (job, start_time, duration, finished) as soon as each segment is decided;
+    job is None for idle gaps. The same contract holds for every *_segments function.
+    """
+    return _fcfs_core(_arrival_ordered(jobs))
+
 def fcfs(processes):
-    processes.sort(key=lambda x: x[1]) 
+    if isinstance(processes, Workload):
+        return _fcfs_workload(processes)
+    processes.sort(key=lambda x: x[1])
     current_time = 0
     schedule = []
     timestamps = []
     completion_times = {}
-    waiting_times = []
-    burst_times = {p[0]: p[2] for p in processes}  
-        
-    for process, arrival_time, cpu_burst, _ in processes:
-        start_time = max(current_time, arrival_time)
+
+    for job, start_time, duration, _ in _fcfs_core(processes):
         timestamps.append(start_time)
-        schedule.append((process, cpu_burst))
-        current_time = start_time + cpu_burst
-        completion_times[process] = current_time  
-        
-    timestamps.append(current_time)
+        schedule.append((job[0], duration))
+        current_time = start_time + duration
+        completion_times[job[0]] = current_time
 
+    timestamps.append(current_time)
+    waiting_times = _waiting_times(processes, completion_times)
 
-    for process, completion_time in completion_times.items():
-        burst_time = burst_times[process]
-        arrival_time = next(p[1] for p in processes if p[0] == process)
-        waiting_time = completion_time - burst_time - arrival_time
-        waiting_times.append((process, waiting_time))
-    
     timestamps = [round(time, 2) for time in timestamps]
     return schedule, timestamps, completion_times, waiting_times
 
+# Quantum arithmetic in floats drifts (4 * 0.1 != 0.4, 1.9 + 0.3 < 2.2), so time-sliced engines
+# compare quantum boundaries, arrivals and remaining work with this tolerance.
+_EPSILON = 1e-9
+
+def _quanta_to_reach(span, time_quantum):
+    # Whole quanta needed to cover span; an arrival exactly on a boundary must not cost an extra quantum.
+    return math.ceil(span / time_quantum - _EPSILON)
+
+def _finish_within(remaining_time, slice_time):
+    # A remainder left only by float error finishes in this slice instead of costing another turn.
+    if slice_time >= remaining_time - _EPSILON:
+        return remaining_time, True
+    return slice_time, False
+
+def _round_robin_core(jobs, time_quantum):
+    jobs = iter(jobs)
+    next_job = next(jobs, None)
+    queue = deque()
+    current_time = 0
+
+    while next_job is not None or queue:
+        while next_job is not None and next_job[1] <= current_time + _EPSILON:
+            queue.append([next_job, next_job[2]])
+            next_job = next(jobs, None)
+
+        if not queue:
+            yield None, current_time, next_job[1] - current_time, False
+            current_time = next_job[1]
+            continue
+
+        entry = queue.popleft()
+        job, remaining_time = entry
+        if queue:
+            slice_time = min(remaining_time, time_quantum)
+        elif next_job is not None:
+            quanta = max(1, _quanta_to_reach(next_job[1] - current_time, time_quantum))
+            slice_time = min(remaining_time, quanta * time_quantum)
+        else:
+            slice_time = remaining_time
+
+        slice_time, finished = _finish_within(remaining_time, slice_time)
+        yield job, current_time, slice_time, finished
+        current_time += slice_time
+
+        if not finished:
+            entry[1] = remaining_time - slice_time
+            while next_job is not None and next_job[1] <= current_time + _EPSILON:
+                queue.append([next_job, next_job[2]])
+                next_job = next(jobs, None)
+            queue.append(entry)
+
+def _check_time_quantum(time_quantum):
+    if time_quantum <= 0:
+        raise ValueError("Time quantum must be positive")
+
+def round_robin_segments(jobs, time_quantum):
+    _check_time_quantum(time_quantum)
+    return _round_robin_core(_arrival_ordered(jobs), time_quantum)
+
 def round_robin(processes, time_quantum):
-    queue = []
+    _check_time_quantum(time_quantum)
+    return _run_core(processes, _round_robin_core, time_quantum)
+
+def _run_core(processes, core, *args):
+    processes = _as_processes(processes)
+    processes.sort(key=lambda x: x[1])
+    current_time = 0
     schedule = []
     timestamps = []
-    current_time = 0
     completion_times = {}
-    waiting_times = []
-    remaining_time_dict = {p[0]: p[2] for p in processes}  
-    
-    processes.sort(key=lambda x: x[1])
-    queue.extend(processes)
-    arrival_times = {p[0]: p[1] for p in processes}  
-
-    while queue:
-        process, arrival_time, cpu_burst, _ = queue.pop(0)
-        if current_time < arrival_time:
-            current_time = arrival_time
-        timestamps.append(current_time)
-        if cpu_burst <= time_quantum:
-            schedule.append((process, cpu_burst))
-            current_time += cpu_burst
-            completion_times[process] = current_time  
-        else:
-            schedule.append((process, time_quantum))
-            current_time += time_quantum
-            remaining_time_dict[process] -= time_quantum
-            queue.append((process, arrival_time, remaining_time_dict[process], _))
 
-    timestamps.append(current_time)
-    
+    for job, start_time, duration, finished in core(processes, *args):
+        timestamps.append(start_time)
+        schedule.append(("Idle" if job is None else job[0], duration))
+        current_time = start_time + duration
+        if finished:
+            completion_times[job[0]] = current_time
 
-    for process, completion_time in completion_times.items():
-        burst_time = remaining_time_dict[process] + time_quantum 
-        arrival_time = arrival_times[process]
-        waiting_time = completion_time - burst_time - arrival_time
-        waiting_times.append((process, waiting_time))
+    timestamps.append(current_time)
+    waiting_times = _waiting_times(processes, completion_times)
 
     timestamps = [round(time, 2) for time in timestamps]
     return schedule, timestamps, completion_times, waiting_times
 
-def srtf(processes):
-    processes.sort(key=lambda x: x[1]) 
+def _preemptive_core(jobs, key):
+    jobs = iter(jobs)
+    next_job = next(jobs, None)
+    ready = []
+    seq = 0
     current_time = 0
-    schedule = []
-    timestamps = []
-    completion_times = {}
-    waiting_times = []
-    remaining_processes = [(p[0], p[1], p[2]) for p in processes]  
-    waiting_queue = []
-    burst_times = {p[0]: p[2] for p in processes}  
-    
-    while remaining_processes or waiting_queue:
-        while remaining_processes and remaining_processes[0][1] <= current_time:
-            waiting_queue.append(remaining_processes.pop(0))
-
-        if waiting_queue:
-            waiting_queue.sort(key=lambda x: x[2])  
-            process, arrival_time, remaining_time = waiting_queue.pop(0)
-            next_arrival_time = remaining_processes[0][1] if remaining_processes else float('inf')
+
+    while next_job is not None or ready:
+        while next_job is not None and next_job[1] <= current_time + _EPSILON:
+            heapq.heappush(ready, (key(next_job[2], next_job[3]), seq, next_job[2], next_job))
+            seq += 1
+            next_job = next(jobs, None)
+
+        if ready:
+            _, _, remaining_time, job = heapq.heappop(ready)
+            next_arrival_time = next_job[1] if next_job is not None else float('inf')
             time_to_next_arrival = next_arrival_time - current_time
 
-            if remaining_time <= time_to_next_arrival:
-                timestamps.append(current_time)
-                schedule.append((process, remaining_time))  
+            if remaining_time <= time_to_next_arrival + _EPSILON:
+                yield job, current_time, remaining_time, True
                 current_time += remaining_time
-                completion_times[process] = current_time  
             else:
-                timestamps.append(current_time)
-                schedule.append((process, time_to_next_arrival))  
+                yield job, current_time, time_to_next_arrival, False
                 remaining_time -= time_to_next_arrival
                 current_time += time_to_next_arrival
-                waiting_queue.append((process, arrival_time, remaining_time))  
+                heapq.heappush(ready, (key(remaining_time, job[3]), seq, remaining_time, job))
+                seq += 1
         else:
-            if remaining_processes:
-                next_arrival_time = remaining_processes[0][1]
-                if current_time != next_arrival_time:
-                    schedule.append(("Idle", next_arrival_time - current_time))
-                    current_time = next_arrival_time
-                    timestamps.append(current_time)
-        
-    timestamps.append(current_time)
+            next_arrival_time = next_job[1]
+            if current_time != next_arrival_time:
+                yield None, current_time, next_arrival_time - current_time, False
+                current_time = next_arrival_time
 
 
-    for process, completion_time in completion_times.items():
-        burst_time = burst_times[process]
-        arrival_time = next(p[1] for p in processes if p[0] == process)
-        waiting_time = completion_time - burst_time - arrival_time
-        waiting_times.append((process, waiting_time))
+def _as_processes(processes):
+    if isinstance(processes, Workload):
+        return processes.to_processes()
+    return processes
 
-    timestamps = [round(time, 2) for time in timestamps]
-    return schedule, timestamps, completion_times, waiting_times
 
-def priority_scheduling(processes):
-    processes.sort(key=lambda x: x[1])  
+def _waiting_times(processes, completion_times):
+    arrival_times = {}
+    for p in processes:
+        arrival_times.setdefault(p[0], p[1])
+    burst_times = {p[0]: p[2] for p in processes}
+    return [(process, completion_time - burst_times[process] - arrival_times[process])
+            for process, completion_time in completion_times.items()]
+
+
+def _run_preemptive(processes, key):
+    processes = _as_processes(processes)
+    processes.sort(key=lambda x: x[1])
     current_time = 0
     schedule = []
     timestamps = []
     completion_times = {}
-    waiting_times = []
-    remaining_processes = [(p[0], p[1], p[2], p[3]) for p in processes]  
-    waiting_queue = []
-    burst_times = {p[0]: p[2] for p in processes}  
-
-    while remaining_processes or waiting_queue:
-        while remaining_processes and remaining_processes[0][1] <= current_time:
-            waiting_queue.append(remaining_processes.pop(0))
-
-        if waiting_queue:
-            waiting_queue.sort(key=lambda x: x[3])  
-            process, arrival_time, remaining_time, priority = waiting_queue.pop(0)
+
+    for job, start_time, duration, finished in _preemptive_core(processes, key):
+        current_time = start_time + duration
+        if job is None:
+            schedule.append(("Idle", duration))
             timestamps.append(current_time)
-            next_arrival_time = remaining_processes[0][1] if remaining_processes else float('inf')
-            time_to_next_arrival = next_arrival_time - current_time
+            continue
+        timestamps.append(start_time)
+        schedule.append((job[0], duration))
+        if finished:
+            completion_times[job[0]] = current_time
 
-            if remaining_time <= time_to_next_arrival:
-                schedule.append((process, remaining_time)) 
-                current_time += remaining_time
-                completion_times[process] = current_time  
+    timestamps.append(current_time)
+    waiting_times = _waiting_times(processes, completion_times)
+
+    timestamps = [round(time, 2) for time in timestamps]
+    return schedule, timestamps, completion_times, waiting_times
+
+def _remaining_time_key(remaining_time, priority):
+    # Rounded so remaining times that differ only by float error tie, as they would in exact arithmetic.
+    return round(remaining_time, 9)
+
+def _priority_key(remaining_time, priority):
+    return priority
+
+def srtf_segments(jobs):
+    return _preemptive_core(_arrival_ordered(jobs), _remaining_time_key)
+
+def priority_segments(jobs):
+    return _preemptive_core(_arrival_ordered(jobs), _priority_key)
+
+def srtf(processes):
+    return _run_preemptive(processes, _remaining_time_key)
+
+def priority_scheduling(processes):
+    return _run_preemptive(processes, _priority_key)
+
+class _ShortestJobQueue:
+    def __init__(self):
+        self.items = []
+        self.seq = 0
+
+    def push(self, job):
+        heapq.heappush(self.items, (job[2], self.seq, job))
+        self.seq += 1
+
+    def pop(self, current_time):
+        return heapq.heappop(self.items)[2]
+
+    def __len__(self):
+        return len(self.items)
+
+
+class _ResponseRatioQueue:
+    # Among jobs with equal bursts the earliest arrival always has the highest response ratio,
+    # so only the head of each burst bucket has to be compared. A head's ratio 1 + (t - arrival) / burst
+    # is a line in t and dispatch times only increase, so the heads sit in the leaves of a kinetic
+    # tournament tree: each node keeps the winner of its two children as of self.now and the time
+    # the loser (if it has the shorter burst, i.e. rises faster) overtakes it. pop replays the
+    # overtakes due by the dispatch time, so a dispatch costs O(log k) for k distinct bursts.
+    def __init__(self):
+        self.capacity = 1
+        self.tree = [None, None]  # 1-based; leaf slot s is node capacity + s, entries (burst, arrival, seq, job)
+        self.versions = [0, 0]
+        self.events = []  # (overtake time, node, version); stale versions are skipped
+        self.stamp = 0
+        self.free = [0]
+        self.buckets = {}  # burst -> (leaf slot, later arrivals as entries)
+        self.zero_bursts = deque()
+        self.now = 0
+        self.seq = 0
+        self.count = 0
+
+    def recompute(self, node):
+        """Replay one match as of self.now; returns whether the node's winner changed."""
+        left, right = self.tree[2 * node], self.tree[2 * node + 1]
+        self.stamp += 1
+        self.versions[node] = self.stamp
+        if left is None or right is None:
+            winner = right if left is None else left
+        else:
+            now = self.now
+            if ((now - left[1] + left[0]) / left[0], -left[1], -left[2]) > \
+                    ((now - right[1] + right[0]) / right[0], -right[1], -right[2]):
+                winner, loser = left, right
             else:
-                schedule.append((process, time_to_next_arrival))  
-                remaining_time -= time_to_next_arrival
-                current_time += time_to_next_arrival
-                waiting_queue.append((process, arrival_time, remaining_time, priority))  
+                winner, loser = right, left
+            if loser[0] < winner[0]:
+                time = (winner[0] * loser[1] - loser[0] * winner[1]) / (winner[0] - loser[0])
+                # Checked a little early: the ratios may already compare as tied before the rounded crossing.
+                time = max(time - _EPSILON * max(1.0, abs(time)), math.nextafter(now, math.inf))
+                heapq.heappush(self.events, (time, node, self.stamp))
+        changed = winner is not self.tree[node]
+        self.tree[node] = winner
+        return changed
+
+    def replay(self, node):
+        while node and self.recompute(node):
+            node //= 2
+
+    def update(self, slot, entry):
+        node = self.capacity + slot
+        self.tree[node] = entry
+        self.replay(node // 2)
+
+    def grow(self):
+        leaves = self.tree[self.capacity:]
+        self.free.extend(range(self.capacity, 2 * self.capacity))
+        self.capacity *= 2
+        self.tree = [None] * self.capacity + leaves + [None] * len(leaves)
+        self.versions = [0] * (2 * self.capacity)
+        self.events = []
+        for node in range(self.capacity - 1, 0, -1):
+            self.recompute(node)
+
+    def advance(self, time):
+        self.now = time
+        while self.events and self.events[0][0] <= time:
+            _, node, version = heapq.heappop(self.events)
+            if self.versions[node] == version:
+                self.replay(node)
+
+    def push(self, job):
+        self.count += 1
+        if job[2] <= 0:
+            self.zero_bursts.append(job)
+            return
+        entry = (job[2], job[1], self.seq, job)
+        self.seq += 1
+        bucket = self.buckets.get(job[2])
+        if bucket is not None:
+            bucket[1].append(entry)
+            return
+        if not self.free:
+            self.grow()
+        slot = self.free.pop()
+        self.buckets[job[2]] = (slot, deque())
+        self.update(slot, entry)
+
+    def pop(self, current_time):
+        self.count -= 1
+        if self.zero_bursts:
+            return self.zero_bursts.popleft()
+        self.advance(current_time)
+        burst, _, _, job = self.tree[1]
+        slot, waiting = self.buckets[burst]
+        if waiting:
+            self.update(slot, waiting.popleft())
         else:
-            if remaining_processes:
-                next_arrival_time = remaining_processes[0][1]
-                if current_time != next_arrival_time:
-                    schedule.append(("Idle", next_arrival_time - current_time))
-                    current_time = next_arrival_time
-                    timestamps.append(current_time)
+            del self.buckets[burst]
+            self.free.append(slot)
+            self.update(slot, None)
+        return job
 
-    timestamps.append(current_time)
+    def __len__(self):
+        return self.count
 
-    for process, completion_time in completion_times.items():
-        burst_time = burst_times[process]
-        arrival_time = next(p[1] for p in processes if p[0] == process)
-        waiting_time = completion_time - burst_time - arrival_time
-        waiting_times.append((process, waiting_time))
 
-    timestamps = [round(time, 2) for time in timestamps]
-    return schedule, timestamps, completion_times, waiting_times
\ No newline at end of file
+def _non_preemptive_core(jobs, queue):
+    jobs = iter(jobs)
+    next_job = next(jobs, None)
+    current_time = 0
+
+    while next_job is not None or queue:
+        while next_job is not None and next_job[1] <= current_time:
+            queue.push(next_job)
+            next_job = next(jobs, None)
+
+        if not queue:
+            yield None, current_time, next_job[1] - current_time, False
+            current_time = next_job[1]
+            continue
+
+        job = queue.pop(current_time)
+        yield job, current_time, job[2], True
+        current_time += job[2]
+
+def sjf_segments(jobs):
+    return _non_preemptive_core(_arrival_ordered(jobs), _ShortestJobQueue())
+
+def hrrn_segments(jobs):
+    return _non_preemptive_core(_arrival_ordered(jobs), _ResponseRatioQueue())
+
+def sjf(processes):
+    """Non-preemptive Shortest Job First."""
+    return _run_core(processes, _non_preemptive_core, _ShortestJobQueue())
+
+def hrrn(processes):
+    """Highest Response Ratio Next: (waiting + burst) / burst, chosen when the CPU is free."""
+    return _run_core(processes, _non_preemptive_core, _ResponseRatioQueue())
+
+def _mlfq_core(jobs, time_quantum, levels, boost_interval):
+    jobs = iter(jobs)
+    next_job = next(jobs, None)
+    queues = [deque() for _ in range(levels)]
+    quanta = [time_quantum * 2 ** level for level in range(levels)]
+    boost = boost_interval if levels > 1 and boost_interval else math.inf
+    next_boost = boost
+    current_time = 0
+
+    while next_job is not None or any(queues):
+        while next_job is not None and next_job[1] <= current_time + _EPSILON:
+            queues[0].append([next_job, next_job[2], 0, 0.0])
+            next_job = next(jobs, None)
+
+        if current_time >= next_boost - _EPSILON:
+            boosted = [entry for queue in queues for entry in queue]
+            for entry in boosted:
+                entry[2] = 0
+                entry[3] = 0.0
+            queues = [deque(boosted)] + [deque() for _ in range(levels - 1)]
+            next_boost = (math.floor(current_time / boost) + 1) * boost
+
+        level = next((level for level, queue in enumerate(queues) if queue), None)
+        if level is None:
+            yield None, current_time, next_job[1] - current_time, False
+            current_time = next_job[1]
+            continue
+
+        entry = queues[level].popleft()
+        job, remaining_time, _, used = entry
+        quantum = quanta[level]
+        next_arrival_time = next_job[1] if next_job is not None else math.inf
+        # New jobs enter the top level, so they preempt anything running below it.
+        interrupt_time = min(next_arrival_time if level > 0 else math.inf, next_boost)
+
+        if level == levels - 1 and not any(queues):
+            # Alone at the bottom level: whole quanta run back to back until something can interrupt.
+            if level == 0 and next_arrival_time < math.inf:
+                first_slice = quantum - used
+                quanta_after = max(0, _quanta_to_reach(next_arrival_time - current_time - first_slice, quantum))
+                slice_time = first_slice + quanta_after * quantum
+            else:
+                slice_time = interrupt_time - current_time
+            slice_time = min(remaining_time, slice_time, interrupt_time - current_time)
+            used = (used + slice_time) % quantum
+            if used < _EPSILON or quantum - used < _EPSILON:
+                used = 0.0
+            expired = used == 0
+        else:
+            slice_time = min(remaining_time, quantum - used, interrupt_time - current_time)
+            expired = slice_time >= quantum - used - _EPSILON
+            used = 0.0 if expired else used + slice_time
+
+        slice_time, finished = _finish_within(remaining_time, slice_time)
+        yield job, current_time, slice_time, finished
+        current_time += slice_time
+        if finished:
+            continue
+
+        entry[1] = remaining_time - slice_time
+        # Jobs that arrived during the slice queue ahead of the one it requeues, as in round robin.
+        while next_job is not None and next_job[1] <= current_time + _EPSILON:
+            queues[0].append([next_job, next_job[2], 0, 0.0])
+            next_job = next(jobs, None)
+        if expired:
+            entry[2] = min(level + 1, levels - 1)
+            entry[3] = 0.0
+            queues[entry[2]].append(entry)
+        else:
+            entry[3] = used
+            queues[level].appendleft(entry)
+
+def _check_mlfq(time_quantum, levels, boost_interval):
+    _check_time_quantum(time_quantum)
+    if levels < 1:
+        raise ValueError("MLFQ needs at least one level")
+    if boost_interval is not None and boost_interval != 0 and not boost_interval > 0:
+        raise ValueError("Boost interval must be positive, or None or 0 to disable boosting")
+
+def mlfq_segments(jobs, time_quantum=2, levels=3, boost_interval=100):
+    _check_mlfq(time_quantum, levels, boost_interval)
+    return _mlfq_core(_arrival_ordered(jobs), time_quantum, levels, boost_interval)
+
+def mlfq(processes, time_quantum=2, levels=3, boost_interval=100):
+    """Multi-level feedback queue.
+
+    Level i runs round robin with a quantum of time_quantum * 2 ** i. Jobs start at the top
+    level, drop one level after using a full quantum, and every boost_interval all jobs move
+    back to the top (None or 0 disables boosting).
+    """
+    _check_mlfq(time_quantum, levels, boost_interval)
+    return _run_core(processes, _mlfq_core, time_quantum, levels, boost_interval)
+
+def _stride(priority):
+    return max(priority, 0) + 1
+
+def _stride_core(jobs, time_quantum):
+    jobs = iter(jobs)
+    next_job = next(jobs, None)
+    ready = []
+    seq = 0
+    current_pass = 0.0
+    current_time = 0
+
+    while next_job is not None or ready:
+        while next_job is not None and next_job[1] <= current_time + _EPSILON:
+            # Newcomers join at the current pass so they cannot claim the CPU time they missed.
+            heapq.heappush(ready, (current_pass, seq, next_job[2], next_job))
+            seq += 1
+            next_job = next(jobs, None)
+
+        if not ready:
+            yield None, current_time, next_job[1] - current_time, False
+            current_time = next_job[1]
+            continue
+
+        job_pass, _, remaining_time, job = heapq.heappop(ready)
+        current_pass = job_pass
+        if ready or next_job is None:
+            slice_time = min(remaining_time, time_quantum) if ready else remaining_time
+        else:
+            quanta = max(1, _quanta_to_reach(next_job[1] - current_time, time_quantum))
+            slice_time = min(remaining_time, quanta * time_quantum)
+
+        slice_time, finished = _finish_within(remaining_time, slice_time)
+        yield job, current_time, slice_time, finished
+        current_time += slice_time
+
+        if not finished:
+            while next_job is not None and next_job[1] <= current_time + _EPSILON:
+                heapq.heappush(ready, (current_pass, seq, next_job[2], next_job))
+                seq += 1
+                next_job = next(jobs, None)
+            job_pass += _stride(job[3]) * round(slice_time / time_quantum, 9)
+            heapq.heappush(ready, (job_pass, seq, remaining_time - slice_time, job))
+            seq += 1
+
+def stride_segments(jobs, time_quantum=2):
+    _check_time_quantum(time_quantum)
+    return _stride_core(_arrival_ordered(jobs), time_quantum)
+
+def stride(processes, time_quantum=2):
+    """Stride scheduling: a deterministic lottery where priority p holds 1 / (p + 1) of the tickets."""
+    _check_time_quantum(time_quantum)
+    return _run_core(processes, _stride_core, time_quantum)
+
+def _aging_key(priority, ready_since, aging_interval):
+    # Rounded so keys that differ only by float error (3.9 / 0.1 vs 39) tie, as they would exactly.
+    return round(priority + ready_since / aging_interval, 9)
+
+def _aging_priority_core(jobs, aging_interval):
+    # A waiting job gains one priority level per aging_interval. All waiting jobs age at the same
+    # rate, so ordering them by priority + ready_since / aging_interval stays valid in a heap.
+    # The running job competes with its base priority, and aging preemptions happen only on
+    # aging_interval boundaries so two jobs cannot trade the CPU back and forth continuously.
+    jobs = iter(jobs)
+    next_job = next(jobs, None)
+    ready = []
+    seq = 0
+    current_time = 0
+    job = None  # the running job; it only rejoins the heap at an aging boundary or for a better arrival
+    remaining_time = 0
+
+    while next_job is not None or ready or job is not None:
+        arrival_priority = math.inf
+        while next_job is not None and next_job[1] <= current_time + _EPSILON:
+            heapq.heappush(ready, (_aging_key(next_job[3], next_job[1], aging_interval), seq, next_job[2], next_job))
+            seq += 1
+            arrival_priority = min(arrival_priority, next_job[3])
+            next_job = next(jobs, None)
+
+        if job is not None and arrival_priority < job[3]:
+            heapq.heappush(ready, (_aging_key(job[3], current_time, aging_interval), seq, remaining_time, job))
+            seq += 1
+            job = None
+
+        if job is None:
+            if not ready:
+                yield None, current_time, next_job[1] - current_time, False
+                current_time = next_job[1]
+                continue
+            _, _, remaining_time, job = heapq.heappop(ready)
+
+        next_arrival_time = next_job[1] if next_job is not None else math.inf
+        check_time = math.inf
+        if ready and aging_interval < math.inf:
+            overtake_time = max((ready[0][0] - job[3]) * aging_interval, current_time)
+            check_time = (math.floor(overtake_time / aging_interval + _EPSILON) + 1) * aging_interval
+            if check_time <= current_time + _EPSILON:
+                check_time += aging_interval
+        slice_time = min(remaining_time, next_arrival_time - current_time, check_time - current_time)
+        at_check = slice_time >= check_time - current_time - _EPSILON
+
+        slice_time, finished = _finish_within(remaining_time, slice_time)
+        yield job, current_time, slice_time, finished
+        current_time += slice_time
+        remaining_time -= slice_time
+        if finished:
+            job = None
+        elif at_check:
+            heapq.heappush(ready, (_aging_key(job[3], current_time, aging_interval), seq, remaining_time, job))
+            seq += 1
+            job = None
+
+def _check_aging_interval(aging_interval):
+    if aging_interval <= 0:
+        raise ValueError("Aging interval must be positive")
+
+def aging_priority_segments(jobs, aging_interval=10):
+    _check_aging_interval(aging_interval)
+    return _aging_priority_core(_arrival_ordered(jobs), aging_interval)
+
+def aging_priority_scheduling(processes, aging_interval=10):
+    """Preemptive priority scheduling where waiting jobs gain one level per aging_interval."""
+    _check_aging_interval(aging_interval)
+    return _run_core(processes, _aging_priority_core, aging_interval)
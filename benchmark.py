@@ -0,0 +1,169 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from compare import QUANTUM_ALGORITHMS, run_algorithm
+from simulate import ALGORITHM_NAMES
+from synthetic import BURST_DISTRIBUTIONS, PRIORITY_DISTRIBUTIONS, generate_workload
+
+DEFAULT_SIZES = [10, 1000, 100000]
+
+# Mirrors main.py up to the first event-loop pass after the window is shown.
+STARTUP_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from PySide6.QtWidgets import QApplication
+from gui import Scheduler
+app = QApplication(sys.argv)
+window = Scheduler()
+window.resize(600, 500)
+window.show()
+app.processEvents()
+print(time.perf_counter() - start, 'matplotlib' in sys.modules)
+"""
+
+
+def measure(workload, algorithm, time_quantum, repeat=1, memory=True):
+    seconds = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        schedule = run_algorithm(workload, algorithm, time_quantum)[0]
+        seconds = min(seconds, time.perf_counter() - start)
+        segments = len(schedule)
+        del schedule
+
+    peak_bytes = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        run_algorithm(workload, algorithm, time_quantum)
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return seconds, peak_bytes, segments
+
+
+def run_benchmarks(sizes, algorithms, time_quantum=2.0, seed=0, repeat=1, memory=True, log=None, **workload_options):
+    results = []
+    for size in sizes:
+        workload = generate_workload(size, seed=seed, **workload_options)
+        for short_name in algorithms:
+            algorithm = ALGORITHM_NAMES[short_name]
+            quantum = time_quantum if algorithm in QUANTUM_ALGORITHMS else None
+            seconds, peak_bytes, segments = measure(workload, algorithm, quantum, repeat, memory)
+            result = {"algorithm": short_name, "size": size, "seconds": seconds,
+                      "peak_bytes": peak_bytes, "segments": segments}
+            results.append(result)
+            if log:
+                log(result)
+    return results
+
+
+def measure_startup(repeat=1):
+    """Time main.py's window coming up in a fresh interpreter; also report whether matplotlib was loaded."""
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    seconds = float("inf")
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT], cwd=os.path.dirname(os.path.abspath(__file__)),
+                                env=env, capture_output=True, text=True, check=True).stdout.split()
+        seconds = min(seconds, float(output[-2]))
+        matplotlib_loaded = output[-1] == "True"
+    return {"algorithm": "startup", "size": 0, "seconds": seconds, "peak_bytes": None, "segments": None,
+            "matplotlib_loaded": matplotlib_loaded}
+
+
+def compare_baseline(results, baseline, threshold):
+    """Return (result, baseline_result, ratio) for every timing that got slower than threshold allows."""
+    previous = {(r["algorithm"], r["size"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = previous.get((result["algorithm"], result["size"]))
+        if old and old["seconds"] > 0:
+            ratio = result["seconds"] / old["seconds"]
+            if ratio > 1 + threshold:
+                regressions.append((result, old, ratio))
+    return regressions
+
+
+def format_result(result):
+    if result["algorithm"] == "startup":
+        loaded = "loaded" if result["matplotlib_loaded"] else "not loaded"
+        return f"{'startup':>8} {'':>10} {result['seconds']:10.4f} s  (matplotlib {loaded})"
+    memory = f"{result['peak_bytes'] / 2 ** 20:10.2f} MiB" if result["peak_bytes"] is not None else "         - MiB"
+    return (f"{result['algorithm']:>8} {result['size']:>10} {result['seconds']:10.4f} s "
+            f"{memory} {result['segments']:>10} segments")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m benchmark",
+                                     description="Benchmark the scheduling algorithms on seeded synthetic workloads.")
+    parser.add_argument("-n", "--sizes", nargs="+", type=int, default=DEFAULT_SIZES, help="workload sizes in jobs")
+    parser.add_argument("-a", "--algorithms", nargs="+", choices=list(ALGORITHM_NAMES), default=list(ALGORITHM_NAMES))
+    parser.add_argument("-q", "--quantum", type=float, default=2.0, help="time quantum for Round Robin, MLFQ and Stride")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--arrival-rate", type=float, default=1.0, help="mean arrivals per unit of time")
+    parser.add_argument("--burst", choices=BURST_DISTRIBUTIONS, default="exponential")
+    parser.add_argument("--mean-burst", type=float, default=0.9)
+    parser.add_argument("--priority", choices=PRIORITY_DISTRIBUTIONS, default="uniform")
+    parser.add_argument("--repeat", type=int, default=1, help="timing runs per measurement; the fastest is kept")
+    parser.add_argument("--startup", action="store_true",
+                        help="time the GUI cold start (main.py up to the shown window) instead of the algorithms")
+    parser.add_argument("--no-memory", action="store_true", help="skip the extra tracemalloc run for peak memory")
+    parser.add_argument("-o", "--output", help="save results as a JSON baseline")
+    parser.add_argument("--baseline", help="compare against a saved JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown against the baseline before failing (default: 0.25)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.startup:
+        config = {"startup": True}
+        results = [measure_startup(args.repeat)]
+        print(format_result(results[0]), flush=True)
+    else:
+        config = {"seed": args.seed, "time_quantum": args.quantum, "arrival_rate": args.arrival_rate,
+                  "burst": args.burst, "mean_burst": args.mean_burst, "priority": args.priority}
+        results = run_benchmarks(args.sizes, args.algorithms, args.quantum, args.seed, args.repeat, not args.no_memory,
+                                 log=lambda result: print(format_result(result), flush=True),
+                                 arrival_rate=args.arrival_rate, burst=args.burst, mean_burst=args.mean_burst,
+                                 priority=args.priority)
+
+    if args.output:
+        report = {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "config": config,
+            "results": results,
+        }
+        with open(args.output, "w") as file:
+            json.dump(report, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)
+        if baseline.get("config") != config:
+            print("benchmark: warning: baseline was recorded with a different configuration", file=sys.stderr)
+        regressions = compare_baseline(results, baseline, args.threshold)
+        for result, old, ratio in regressions:
+            print(f"REGRESSION {result['algorithm']} n={result['size']}: "
+                  f"{old['seconds']:.4f} s -> {result['seconds']:.4f} s ({ratio:.2f}x)")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+# Part of every key; bump it whenever a cached result type changes shape (e.g. a new ComparisonResult
+# field) so entries written by older versions are never read back.
+CACHE_FORMAT = 3
+
+
+def workload_fingerprint(workload):
+    digest = hashlib.sha256()
+    for column in (workload.name_ids, workload.arrival, workload.burst, workload.priority):
+        digest.update(column.tobytes())
+    digest.update("\0".join(workload.names).encode())
+    return digest.hexdigest()
+
+
+def cache_key(fingerprint, kind, algorithm, **params):
+    parts = [f"v{CACHE_FORMAT}", fingerprint, kind, algorithm] + [f"{name}={params[name]!r}" for name in sorted(params)]
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()
+
+
+class SimulationCache:
+    """LRU cache of simulation results with an optional pickle store on disk."""
+
+    def __init__(self, maxsize=32, directory=None):
+        self.maxsize = maxsize
+        self.directory = directory
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.pickle")
+
+    def get(self, key, default=None):
+        with self.lock:
+            if key in self.entries:
+                self.entries.move_to_end(key)
+                return self.entries[key]
+        if self.directory:
+            try:
+                with open(self._path(key), "rb") as file:
+                    value = pickle.load(file)
+            except Exception:  # unreadable, truncated or written by an incompatible version: a miss
+                return default
+            self._remember(key, value)
+            return value
+        return default
+
+    def put(self, key, value):
+        self._remember(key, value)
+        if self.directory:
+            # A private temporary file per writer, so concurrent puts of one key never share it.
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as file:
+                    pickle.dump(value, file, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(temp_path, self._path(key))
+            except BaseException:
+                os.remove(temp_path)
+                raise
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def _remember(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
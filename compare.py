@@ -0,0 +1,190 @@
+import math
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from algorithms import (
+    fcfs, round_robin, srtf, priority_scheduling, sjf, hrrn, mlfq, stride, aging_priority_scheduling,
+    fcfs_segments, round_robin_segments, srtf_segments, priority_segments, sjf_segments, hrrn_segments,
+    mlfq_segments, stride_segments, aging_priority_segments,
+)
+from cache import cache_key, workload_fingerprint
+from workload import Workload, job_metrics
+
+ALGORITHMS = {
+    "FCFS": fcfs,
+    "Round Robin": round_robin,
+    "SRTF": srtf,
+    "Priority Scheduling": priority_scheduling,
+    "SJF": sjf,
+    "HRRN": hrrn,
+    "MLFQ": mlfq,
+    "Stride": stride,
+    "Priority with Aging": aging_priority_scheduling,
+}
+
+SEGMENT_ENGINES = {
+    "FCFS": fcfs_segments,
+    "Round Robin": round_robin_segments,
+    "SRTF": srtf_segments,
+    "Priority Scheduling": priority_segments,
+    "SJF": sjf_segments,
+    "HRRN": hrrn_segments,
+    "MLFQ": mlfq_segments,
+    "Stride": stride_segments,
+    "Priority with Aging": aging_priority_segments,
+}
+
+QUANTUM_ALGORITHMS = {"Round Robin", "MLFQ", "Stride"}
+PRIORITY_ALGORITHMS = {"Priority Scheduling", "Stride", "Priority with Aging"}
+
+PARALLEL_MIN_JOBS = 5000
+
+ComparisonResult = namedtuple(
+    "ComparisonResult",
+    ["label", "algorithm", "time_quantum", "average_waiting_time", "average_turnaround_time", "total_time", "segments",
+     "context_switches"],
+)
+
+
+def comparison_variants(algorithms=None, time_quanta=(2,)):
+    variants = []
+    for algorithm in algorithms or ALGORITHMS:
+        if algorithm in QUANTUM_ALGORITHMS:
+            for time_quantum in time_quanta:
+                label = algorithm if len(time_quanta) == 1 else f"{algorithm} (q={time_quantum:g})"
+                variants.append((label, algorithm, time_quantum))
+        else:
+            variants.append((algorithm, algorithm, None))
+    return variants
+
+
+def run_algorithm(workload, algorithm, time_quantum=None):
+    if time_quantum is None:
+        return ALGORITHMS[algorithm](workload)
+    return ALGORITHMS[algorithm](workload, time_quantum)
+
+
+def context_switches(schedule):
+    switches = 0
+    previous = None
+    for process, _ in schedule:
+        if process == "Idle":
+            continue
+        if previous is not None and process != previous:
+            switches += 1
+        previous = process
+    return switches
+
+
+def schedule_span(lanes):
+    """Time from the first non-idle start to the last end over (schedule, timestamps) lanes.
+
+    Idle time before the first job is left out, as in summarize_segments; timestamps[i] is only a
+    start time for busy segments (SRTF/Priority store the end of an idle gap).
+    """
+    start_time = min((next((time for (process, _), time in zip(schedule, timestamps) if process != "Idle"), math.inf)
+                      for schedule, timestamps in lanes), default=math.inf)
+    if start_time == math.inf:
+        return 0.0
+    return max(timestamps[-1] for _, timestamps in lanes) - start_time
+
+
+def summarize(workload, label, algorithm, time_quantum, result):
+    schedule, timestamps, completion_times, _ = result
+    metrics = job_metrics(workload, workload.align(completion_times))
+    average_waiting_time = float(metrics["waiting"].mean()) if completion_times else 0.0
+    average_turnaround_time = float(metrics["turnaround"].mean()) if completion_times else 0.0
+    total_time = schedule_span([(schedule, timestamps)])
+    return ComparisonResult(label, algorithm, time_quantum, average_waiting_time,
+                            average_turnaround_time, total_time, len(schedule), context_switches(schedule))
+
+
+def stream_algorithm(jobs, algorithm, time_quantum=None):
+    if time_quantum is None:
+        return SEGMENT_ENGINES[algorithm](jobs)
+    return SEGMENT_ENGINES[algorithm](jobs, time_quantum)
+
+
+def summarize_segments(label, algorithm, time_quantum, segments):
+    """Summarize a segment stream in constant memory, consuming it as it is produced."""
+    count = 0
+    waiting_total = 0.0
+    turnaround_total = 0.0
+    segment_count = 0
+    switches = 0
+    previous = None
+    first_time = None
+    end_time = 0
+    for job, start_time, duration, finished in segments:
+        segment_count += 1
+        end_time = start_time + duration
+        if job is None:
+            continue
+        if first_time is None:
+            first_time = start_time
+        if previous is not None and job[0] != previous:
+            switches += 1
+        previous = job[0]
+        if finished:
+            turnaround = end_time - job[1]
+            turnaround_total += turnaround
+            waiting_total += turnaround - job[2]
+            count += 1
+
+    average_waiting_time = waiting_total / count if count else 0.0
+    average_turnaround_time = turnaround_total / count if count else 0.0
+    total_time = end_time - first_time if first_time is not None else 0.0
+    return ComparisonResult(label, algorithm, time_quantum, average_waiting_time,
+                            average_turnaround_time, total_time, segment_count, switches)
+
+
+def run_variant(workload, label, algorithm, time_quantum=None):
+    result = run_algorithm(workload, algorithm, time_quantum)
+    return summarize(workload, label, algorithm, time_quantum, result)
+
+
+def compare_algorithms(processes, algorithms=None, time_quanta=(2,), max_workers=None, cache=None, progress=None):
+    """Run every requested algorithm variant on the workload, in parallel for large inputs.
+
+    progress(done, total) is called after each variant; an exception raised from it aborts the comparison.
+    """
+    workload = processes if isinstance(processes, Workload) else Workload.from_processes(processes)
+    variants = comparison_variants(algorithms, time_quanta)
+
+    results = {}
+    keys = {}
+    if cache is not None:
+        fingerprint = workload_fingerprint(workload)
+        for label, algorithm, time_quantum in variants:
+            keys[label] = cache_key(fingerprint, "summary", algorithm, label=label, time_quantum=time_quantum)
+            cached = cache.get(keys[label])
+            if cached is not None:
+                results[label] = cached
+    pending = [variant for variant in variants if variant[0] not in results]
+
+    computed = []
+    if progress:
+        progress(len(results), len(variants))
+    if max_workers == 1 or len(pending) <= 1 or len(workload) < PARALLEL_MIN_JOBS:
+        for variant in pending:
+            computed.append(run_variant(workload, *variant))
+            if progress:
+                progress(len(results) + len(computed), len(variants))
+    else:
+        # Spawned, not forked: the GUI calls this from a pool thread of a multi-threaded Qt process.
+        executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+        try:
+            futures = [executor.submit(run_variant, workload, *variant) for variant in pending]
+            for future in as_completed(futures):
+                computed.append(future.result())
+                if progress:
+                    progress(len(results) + len(computed), len(variants))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    for result in computed:
+        results[result.label] = result
+        if cache is not None:
+            cache.put(keys[result.label], result)
+    return [results[label] for label, _, _ in variants]
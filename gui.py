@@ -1,77 +1,346 @@
-from PySide6.QtWidgets import *
-from PySide6.QtCore import *
-from PySide6.QtGui import *
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-from algorithms import fcfs, round_robin, srtf, priority_scheduling
+from PySide6.QtWidgets import (
+    QAbstractItemView, QCheckBox, QComboBox, QDialog, QFileDialog, QHBoxLayout, QLabel, QLineEdit, QMessageBox,
+    QProgressBar, QPushButton, QSlider, QSpinBox, QTabWidget, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget,
+)
+from PySide6.QtCore import QElapsedTimer, QPointF, QRectF, QThreadPool, QTimer, Qt, Signal
+from PySide6.QtGui import (
+    QBrush, QColor, QDoubleValidator, QFont, QFontDatabase, QFontMetrics, QPainter, QPixmap,
+)
+from compare import (
+    PRIORITY_ALGORITHMS, QUANTUM_ALGORITHMS, compare_algorithms, run_algorithm, schedule_span, stream_algorithm,
+)
+from cache import SimulationCache, cache_key, workload_fingerprint
+from instrumentation import PHASES, profile_algorithm
+from metrics import schedule_metrics
+from multicore import POLICY_KEYS, simulate_multicore
+from sweep import sweep_round_robin
+from workload import Workload
+from profiler import profile_file
+from schedules import ScheduleFile, ScheduleWriter, write_schedule_file
+from workers import Worker
+import os
+import shutil
 import time
-import importlib.util
+from bisect import bisect_left, bisect_right
+from collections import deque
+from itertools import accumulate
+
+class GanttLane:
+    __slots__ = ("title", "schedules", "timestamps", "offsets", "progress", "cache_progress", "last_label_end")
+
+    def __init__(self, title, schedules, timestamps):
+        self.title = title
+        self.schedules = schedules
+        self.timestamps = timestamps
+        self.offsets = list(accumulate((duration for _, duration in schedules), initial=0))
+        self.progress = 0
+        self.cache_progress = 0
+        self.last_label_end = None
+
 
 class GanttChart(QWidget):
+    BAR_TOP = 50
+    BAR_HEIGHT = 50
+    LANE_GAP = 25
+    MIN_BAR_HEIGHT = 14
+    LANE_TITLE_WIDTH = 45
+    LABEL_PADDING = 6
+    FRAME_INTERVAL = 33  # ms, caps playback at ~30 repaints per second
+
+    position_changed = Signal(float)
+    playing_changed = Signal(bool)
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.schedules = []
-        self.timestamps = []
+        self.lanes = []
+        self.end_time = 0.0
         self.current_time = 0
-        self.simulation_progress = 0
+        self.speed = 1.0
+        self.clock = QElapsedTimer()
+        self.timer = QTimer(self)
+        self.timer.setInterval(self.FRAME_INTERVAL)
+        self.timer.timeout.connect(self.advance_playback)
+        self.view_start = 0.0
+        self.view_span = 0.0
+        self.drag_origin = None
+        self.cache_pixmap = None
+        self.cache_key = None
+        self.bar_brush = QBrush(QColor(100, 150, 250))
+        self.merged_brush = QBrush(QColor(70, 110, 200))
+        self.name_font = QFont('Arial', 12)
+        self.time_font = QFont('Arial', 10)
+        self.name_metrics = QFontMetrics(self.name_font)
+        self.time_metrics = QFontMetrics(self.time_font)
         self.setMinimumHeight(200)
+        self.setToolTip("Scroll to zoom, drag to pan, double-click to reset the view")
 
     def set_schedule(self, schedules, timestamps):
-        self.schedules = schedules
-        self.timestamps = timestamps
-        self.simulation_progress = 0
+        self.set_lanes([(schedules, timestamps)])
+
+    def set_lanes(self, lanes):
+        """Show one Gantt lane per (schedule, timestamps) pair, e.g. one per simulated core."""
+        titles = [""] if len(lanes) == 1 else [f"CPU {i}" for i in range(len(lanes))]
+        self.lanes = [GanttLane(title, schedules, timestamps) for title, (schedules, timestamps) in zip(titles, lanes)]
+        self.end_time = max((lane.offsets[-1] for lane in self.lanes), default=0.0)
         self.current_time = 0
+        self.setMinimumHeight(max(200, 30 + len(self.lanes) * (self.MIN_BAR_HEIGHT + self.LANE_GAP)))
+        self.reset_view()
+
+    def total_duration(self):
+        return self.end_time or 1.0
+
+    def reset_view(self):
+        self.view_start = 0.0
+        self.view_span = self.total_duration()
+        self.invalidate_cache()
+
+    def invalidate_cache(self):
+        self.cache_key = None
         self.update()
 
-    def start_simulation(self, interval=1000):
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.update_simulation)
-        self.timer.start(interval)
-
-    def update_simulation(self):
-        if self.simulation_progress < len(self.schedules):
-            self.simulation_progress += 1
-            self.current_time = self.timestamps[self.simulation_progress]
-            self.update()
-        else:
+    def start_simulation(self):
+        self.seek(0.0)
+        self.play()
+
+    def set_speed(self, speed):
+        self.speed = speed
+
+    def is_playing(self):
+        return self.timer.isActive()
+
+    def play(self):
+        if not self.lanes:
+            return
+        if self.current_time >= self.end_time:
+            self.seek(0.0)
+        self.clock.start()
+        self.timer.start()
+        self.playing_changed.emit(True)
+
+    def pause(self):
+        if self.timer.isActive():
             self.timer.stop()
-            self.update()
+            self.playing_changed.emit(False)
+
+    def toggle_playback(self):
+        if self.is_playing():
+            self.pause()
+        else:
+            self.play()
+
+    def seek(self, time):
+        """Move playback to a point on the schedule's time axis; segments finished by then are shown."""
+        self.current_time = min(max(time, 0.0), self.end_time)
+        for lane in self.lanes:
+            lane.progress = bisect_right(lane.offsets, self.current_time) - 1
+        self.position_changed.emit(self.current_time)
+        self.update()
+
+    def advance_playback(self):
+        elapsed = self.clock.restart() / 1000
+        self.seek(self.current_time + elapsed * self.speed)
+        if self.current_time >= self.end_time:
+            self.pause()
+
+    def chart_left(self):
+        return self.LANE_TITLE_WIDTH if len(self.lanes) > 1 else 0
+
+    def time_to_x(self, time):
+        left = self.chart_left()
+        return left + (time - self.view_start) / self.view_span * (self.width() - left)
+
+    def x_to_time(self, x):
+        left = self.chart_left()
+        return self.view_start + (x - left) / max(self.width() - left, 1) * self.view_span
+
+    def lane_geometry(self, index):
+        if len(self.lanes) == 1:
+            return self.BAR_TOP, self.BAR_HEIGHT
+        bar_height = (self.height() - 30) / len(self.lanes) - self.LANE_GAP
+        bar_height = max(self.MIN_BAR_HEIGHT, min(self.BAR_HEIGHT, bar_height))
+        return 30 + index * (bar_height + self.LANE_GAP), bar_height
+
+    def set_view(self, start, span):
+        total = self.total_duration()
+        self.view_span = min(max(span, total * 1e-9), total)
+        self.view_start = min(max(start, 0.0), total - self.view_span)
+        self.invalidate_cache()
+
+    def wheelEvent(self, event):
+        if not self.lanes:
+            return
+        anchor = self.x_to_time(event.position().x())
+        factor = 0.8 ** (event.angleDelta().y() / 120)
+        span = self.view_span * factor
+        self.set_view(anchor - (anchor - self.view_start) * factor, span)
+
+    def mousePressEvent(self, event):
+        self.drag_origin = (event.position().x(), self.view_start)
+
+    def mouseMoveEvent(self, event):
+        if self.drag_origin is not None and self.lanes:
+            origin_x, origin_start = self.drag_origin
+            chart_width = max(self.width() - self.chart_left(), 1)
+            self.set_view(origin_start - (event.position().x() - origin_x) / chart_width * self.view_span,
+                          self.view_span)
+
+    def mouseReleaseEvent(self, event):
+        self.drag_origin = None
+
+    def mouseDoubleClickEvent(self, event):
+        if self.lanes:
+            self.reset_view()
+
+    def paint_segments(self, painter, lane, top, bar_height, first, last):
+        """Paint a lane's segments [first, last) that intersect the view, merging sub-pixel runs into one bar."""
+        offsets = lane.offsets
+        view_end = self.view_start + self.view_span
+        i = max(first, bisect_right(offsets, self.view_start) - 1)
+        last = min(last, bisect_left(offsets, view_end))
+
+        while i < last:
+            x = self.time_to_x(offsets[i])
+            segment_width = self.time_to_x(offsets[i + 1]) - x
+            if segment_width >= 1:
+                process = lane.schedules[i][0]
+                painter.setBrush(self.bar_brush)
+                painter.setPen(Qt.black)
+                painter.drawRect(QRectF(x, top, segment_width, bar_height))
+                if self.name_metrics.horizontalAdvance(process) < segment_width:
+                    painter.setFont(self.name_font)
+                    painter.drawText(int(x + segment_width / 2) - 10, int(top + bar_height * 0.7), process)
+                self.paint_time_label(painter, lane, x, top + bar_height + 20, lane.timestamps[i])
+                i += 1
+            else:
+                merged_end = max(i + 1, min(last, bisect_left(offsets, self.x_to_time(int(x) + 1))))
+                painter.setPen(Qt.NoPen)
+                painter.setBrush(self.merged_brush)
+                painter.drawRect(QRectF(x, top, max(self.time_to_x(offsets[merged_end]) - x, 1), bar_height))
+                i = merged_end
+
+    def paint_time_label(self, painter, lane, x, y, time):
+        if lane.last_label_end is not None and x < lane.last_label_end + self.LABEL_PADDING:
+            return
+        label = str(time)
+        painter.setPen(Qt.white)
+        painter.setFont(self.time_font)
+        painter.drawText(int(x), int(y), label)
+        lane.last_label_end = x + self.time_metrics.horizontalAdvance(label)
 
     def paintEvent(self, event):
-        if not self.schedules or self.simulation_progress == 0:
+        if not self.lanes or self.current_time == 0:
             return
 
+        key = (self.width(), self.height(), self.view_start, self.view_span, id(self.lanes))
+        if key != self.cache_key or any(lane.progress < lane.cache_progress for lane in self.lanes):
+            ratio = self.devicePixelRatioF()
+            self.cache_pixmap = QPixmap(self.size() * ratio)
+            self.cache_pixmap.setDevicePixelRatio(ratio)
+            self.cache_pixmap.fill(Qt.transparent)
+            self.cache_key = key
+            for lane in self.lanes:
+                lane.cache_progress = 0
+                lane.last_label_end = None
+
+        cache_painter = None
+        for index, lane in enumerate(self.lanes):
+            if lane.cache_progress < lane.progress:
+                if cache_painter is None:
+                    cache_painter = QPainter(self.cache_pixmap)
+                    cache_painter.setRenderHint(QPainter.Antialiasing)
+                top, bar_height = self.lane_geometry(index)
+                self.paint_segments(cache_painter, lane, top, bar_height, lane.cache_progress, lane.progress)
+                lane.cache_progress = lane.progress
+        if cache_painter is not None:
+            cache_painter.end()
+
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        width = self.width()
-        height = self.height()
-        total_duration = self.timestamps[-1] 
-
-        x = 0
-        for i, (process, duration) in enumerate(self.schedules[:self.simulation_progress]):
-            process_width = (float(duration) / float(total_duration)) * width  
-            painter.setBrush(QColor(100, 150, 250))
-            painter.drawRect(x, 50, process_width, 50)
-            painter.setPen(Qt.black)
-            painter.setFont(QFont('Arial', 12))
-            painter.drawText(int(x + process_width / 2) - 10, 85, process)
-            painter.setPen(Qt.white)
-            painter.setFont(QFont('Arial', 10))
-            painter.drawText(int(x), 120, str(self.timestamps[i]))
-            x += process_width
-
-        if self.simulation_progress == len(self.schedules):
-            painter.setPen(Qt.white)
-            painter.drawText(int(x), 120, str(self.timestamps[-1]))
+        painter.drawPixmap(0, 0, self.cache_pixmap)
+
+        first_top, _ = self.lane_geometry(0)
+        last_top, last_height = self.lane_geometry(len(self.lanes) - 1)
+        playhead_x = self.time_to_x(self.current_time)
+        painter.setPen(Qt.red)
+        painter.drawLine(QPointF(playhead_x, first_top - 5), QPointF(playhead_x, last_top + last_height + 5))
+
+        painter.setFont(self.time_font)
+        for index, lane in enumerate(self.lanes):
+            top, bar_height = self.lane_geometry(index)
+            if lane.title:
+                painter.setPen(Qt.black)
+                painter.drawText(2, int(top + bar_height / 2 + 5), lane.title)
+            if lane.progress == len(lane.schedules):
+                painter.setPen(Qt.white)
+                painter.drawText(int(self.time_to_x(lane.offsets[-1])), int(top + bar_height + 20), str(lane.timestamps[-1]))
 
         painter.end()
 
+def simulate_workload(workload, algorithm, time_quantum, cores, mode, comparison_quantum, cache, profile, progress):
+    # progress(0, 0) between the phases shows a busy bar and, once cancelled, stops before the next phase.
+    comparison_results = compare_algorithms(workload, time_quanta=[comparison_quantum], cache=cache, progress=progress)
+    progress(0, 0)
+    fingerprint = workload_fingerprint(workload)
+    if cores == 1:
+        key = cache_key(fingerprint, "schedule", algorithm, time_quantum=time_quantum)
+        schedule, timestamps, _, waiting_times = cache.get_or_compute(
+            key, lambda: run_algorithm(workload, algorithm, time_quantum))
+        lanes = [(schedule, timestamps)]
+        progress(0, 0)
+        metrics = schedule_metrics(workload.to_processes(), lanes)
+        engine_profile = None
+        if profile:
+            progress(0, 0)
+            # Profiling reruns the engine: timings are the point, so the result is never cached.
+            engine_profile = profile_algorithm(workload, algorithm, time_quantum).report()
+        return lanes, waiting_times, None, metrics, comparison_results, engine_profile
+
+    key = cache_key(fingerprint, "multicore", algorithm, time_quantum=time_quantum, cores=cores, mode=mode)
+    lanes, _, waiting_times, utilization = cache.get_or_compute(
+        key, lambda: simulate_multicore(workload, algorithm, cores, mode, time_quantum))
+    progress(0, 0)
+    return lanes, waiting_times, utilization, schedule_metrics(workload.to_processes(), lanes), comparison_results, None
+
+def figure_canvas():
+    # matplotlib takes longer to import than everything else in the GUI, so it loads on the first plot.
+    from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
+    from matplotlib.figure import Figure
+    figure = Figure(figsize=(8, 6))
+    return figure, FigureCanvasQTAgg(figure)
+
+def load_schedule_file(path, progress):
+    return ScheduleFile(path).to_lanes()
+
+def save_schedule_file(path, source, progress):
+    """Write the shown schedule with exact start times, which the rounded lane timestamps lose.
+
+    source is the opened .sched file, copied as is, or the (workload, algorithm, time_quantum,
+    cores, mode) run, which is replayed: one core through its segment stream, several cores
+    through an unrounded simulation.
+    """
+    if isinstance(source, str):
+        if not (os.path.exists(path) and os.path.samefile(source, path)):
+            shutil.copyfile(source, path)
+        return
+    workload, algorithm, time_quantum, cores, mode = source
+    if cores == 1:
+        jobs = sorted(workload.to_processes(), key=lambda job: job[1])
+        with ScheduleWriter(path) as writer:
+            deque(writer.observe(stream_algorithm(iter(jobs), algorithm, time_quantum)), maxlen=0)
+    else:
+        write_schedule_file(path, simulate_multicore(workload, algorithm, cores, mode, time_quantum, rounded=False)[0])
+
 class Scheduler(QWidget):
+    SLIDER_STEPS = 10000
+
     def __init__(self):
         super().__init__()
         
         self.setWindowTitle("Scheduling Algorithm Visualizer")
+        self.simulation_cache = SimulationCache(maxsize=32, directory=os.environ.get("SCHEDULER_CACHE_DIR"))
+        self.thread_pool = QThreadPool.globalInstance()
+        self.active_worker = None
+        self.requested_source = None  # what the pending run will show; see save_schedule_file
+        self.schedule_source = None
         self.layout = QVBoxLayout(self)
         self.input_layout = QVBoxLayout()
 
@@ -87,6 +356,10 @@ class Scheduler(QWidget):
         self.start_button = QPushButton("Start Scheduling")
         self.compare_button = QPushButton("Compare")
         self.clear_table_button = QPushButton("Clear Table")
+        self.save_schedule_button = QPushButton("Save Schedule")
+        self.open_schedule_button = QPushButton("Open Schedule")
+        self.save_schedule_button.clicked.connect(self.save_schedule)
+        self.open_schedule_button.clicked.connect(self.open_schedule)
         self.compare_button.clicked.connect(self.show_comparison_window)
         self.add_file_button.clicked.connect(self.open_file_dialog)
         self.start_button.clicked.connect(self.start_scheduling)
@@ -94,7 +367,8 @@ class Scheduler(QWidget):
         self.clear_table_button.clicked.connect(self.clear_table)
 
         self.algorithm_select = QComboBox()
-        self.algorithm_select.addItems(["FCFS", "Round Robin", "SRTF", "Priority Scheduling"])
+        self.algorithm_select.addItems(["FCFS", "Round Robin", "SRTF", "Priority Scheduling", "SJF", "HRRN", "MLFQ",
+                                        "Stride", "Priority with Aging"])
         self.algorithm_select.currentIndexChanged.connect(self.update_visibility)
 
         self.input_layout.addWidget(QLabel("Select Algorithm:"))
@@ -108,59 +382,119 @@ class Scheduler(QWidget):
         self.input_layout.addWidget(self.quantum_input_label)
         self.input_layout.addWidget(self.quantum_input)
 
+        cores_layout = QHBoxLayout()
+        self.cores_input = QSpinBox()
+        self.cores_input.setRange(1, 256)
+        self.partitioned_check = QCheckBox("Per-core queues with work stealing")
+        cores_layout.addWidget(QLabel("CPU Cores:"))
+        cores_layout.addWidget(self.cores_input)
+        cores_layout.addWidget(self.partitioned_check)
+        self.profile_check = QCheckBox("Profile engine")
+        self.profile_check.setToolTip("Count dispatches, preemptions and ready-queue lengths and time each phase")
+        cores_layout.addWidget(self.profile_check)
+        cores_layout.addStretch()
+        self.cores_input.valueChanged.connect(self.update_visibility)
+        self.input_layout.addLayout(cores_layout)
+
         button_layout = QHBoxLayout()
         button_layout.addWidget(self.add_process_button)
         button_layout.addWidget(self.add_file_button)
         button_layout.addWidget(self.start_button)
         button_layout.addWidget(self.compare_button)
         button_layout.addWidget(self.clear_table_button) 
+        button_layout.addWidget(self.save_schedule_button)
+        button_layout.addWidget(self.open_schedule_button)
         self.input_layout.addLayout(button_layout)
 
         self.layout.addLayout(self.input_layout)
 
+        progress_layout = QHBoxLayout()
+        self.progress_bar = QProgressBar()
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel_background)
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.cancel_button)
+        self.layout.addLayout(progress_layout)
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+
         self.gantt_chart = GanttChart(self)
         self.layout.addWidget(self.gantt_chart)
 
+        playback_layout = QHBoxLayout()
+        self.play_button = QPushButton("Play")
+        self.play_button.clicked.connect(self.gantt_chart.toggle_playback)
+        self.speed_select = QComboBox()
+        self.speed_select.addItems(["0.5x", "1x", "2x", "5x", "10x", "100x", "1000x", "10000x"])
+        self.speed_select.setCurrentText("1x")
+        self.speed_select.currentTextChanged.connect(lambda text: self.gantt_chart.set_speed(float(text[:-1])))
+        self.position_slider = QSlider(Qt.Horizontal)
+        self.position_slider.setRange(0, self.SLIDER_STEPS)
+        self.position_slider.sliderMoved.connect(self.seek_playback)
+        self.gantt_chart.position_changed.connect(self.show_playback_position)
+        self.gantt_chart.playing_changed.connect(lambda playing: self.play_button.setText("Pause" if playing else "Play"))
+        playback_layout.addWidget(self.play_button)
+        playback_layout.addWidget(QLabel("Speed:"))
+        playback_layout.addWidget(self.speed_select)
+        playback_layout.addWidget(self.position_slider)
+        self.layout.addLayout(playback_layout)
+
         self.total_time_label = QLabel("Total Time: 0")
         self.layout.addWidget(self.total_time_label)
 
         self.average_waiting_time_label = QLabel("Average Waiting Time: 0.00")
         self.layout.addWidget(self.average_waiting_time_label)
+
+        self.utilization_label = QLabel()
+        self.utilization_label.setWordWrap(True)
+        self.layout.addWidget(self.utilization_label)
+        self.utilization_label.hide()
+
+        self.metrics_label = QLabel()
+        self.metrics_label.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.layout.addWidget(self.metrics_label)
+        self.metrics_label.hide()
+
+        self.profile_label = QLabel()
+        self.profile_label.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.layout.addWidget(self.profile_label)
+        self.profile_label.hide()
         self.layout.addWidget(self.total_time_label)
 
         self.update_visibility()
 
 
     def update_visibility(self):
-        if self.algorithm_select.currentText() == "Round Robin":
-            self.quantum_input_label.show()
-            self.quantum_input.show()
-            self.process_table.setColumnHidden(3, True)
-
-        elif self.algorithm_select.currentText() == "Priority Scheduling":
-            self.quantum_input_label.hide()
-            self.quantum_input.hide()
-            self.process_table.setColumnHidden(3, False)
-        else:
-            self.quantum_input_label.hide()
-            self.quantum_input.hide()
-            self.process_table.setColumnHidden(3, True)
+        algorithm = self.algorithm_select.currentText()
+        self.quantum_input_label.setVisible(algorithm in QUANTUM_ALGORITHMS)
+        self.quantum_input.setVisible(algorithm in QUANTUM_ALGORITHMS)
+        self.process_table.setColumnHidden(3, algorithm not in PRIORITY_ALGORITHMS)
+        # The multi-core simulator only implements the original four policies.
+        self.cores_input.setEnabled(algorithm in POLICY_KEYS)
+        self.partitioned_check.setEnabled(algorithm in POLICY_KEYS)
+        # Only the single-core engines are instrumented, so profiling follows the effective core count.
+        self.profile_check.setEnabled(algorithm not in POLICY_KEYS or self.cores_input.value() == 1)
 
 
 
 
     def show_comparison_window(self):
         if not hasattr(self, 'average_waiting_times'):
-            self.compute_average_waiting_times()  # Calculate average waiting times if not already calculated
+            # Calculate average waiting times in the background, then come back here
+            self.compute_average_waiting_times(on_done=self.show_comparison_window)
+            return
 
         dialog = QDialog(self)
         dialog.setWindowTitle("Average Waiting Times Comparison")
-        dialog.setGeometry(100, 100, 600, 500)
+        dialog.setGeometry(100, 100, 700, 650)
 
         layout = QVBoxLayout()
+        tabs = QTabWidget()
+
+        comparison_tab = QWidget()
+        comparison_layout = QVBoxLayout(comparison_tab)
 
-        figure = Figure(figsize=(8, 6))
-        canvas = FigureCanvas(figure)
+        figure, canvas = figure_canvas()
         ax = figure.add_subplot(111)
 
         algorithms = list(self.average_waiting_times.keys())
@@ -170,13 +504,82 @@ class Scheduler(QWidget):
         ax.set_xlabel('Algorithms')
         ax.set_ylabel('Average Waiting Time')
         ax.set_title('Comparison of Average Waiting Times')
-
-        layout.addWidget(canvas)
-
+        ax.tick_params(axis='x', labelrotation=30)
+        figure.tight_layout()
+
+        comparison_layout.addWidget(canvas)
+
+        columns = ["Algorithm", "Avg Waiting", "Avg Turnaround", "Total Time", "Segments", "Context Switches"]
+        results_table = QTableWidget(len(self.comparison_results), len(columns))
+        results_table.setHorizontalHeaderLabels(columns)
+        results_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        for row, result in enumerate(self.comparison_results):
+            values = [result.label, f"{result.average_waiting_time:.2f}", f"{result.average_turnaround_time:.2f}",
+                      f"{result.total_time:.2f}", str(result.segments), str(result.context_switches)]
+            for column, value in enumerate(values):
+                results_table.setItem(row, column, QTableWidgetItem(value))
+        comparison_layout.addWidget(results_table)
+        tabs.addTab(comparison_tab, "Algorithms")
+
+        sweep_tab = QWidget()
+        sweep_layout = QVBoxLayout(sweep_tab)
+        sweep_inputs = QHBoxLayout()
+        quanta_input = QLineEdit("0.5, 1, 2, 4, 8")
+        scales_input = QLineEdit("1")
+        run_sweep_button = QPushButton("Run Sweep")
+        sweep_inputs.addWidget(QLabel("Quanta:"))
+        sweep_inputs.addWidget(quanta_input)
+        sweep_inputs.addWidget(QLabel("Arrival rate scales:"))
+        sweep_inputs.addWidget(scales_input)
+        sweep_inputs.addWidget(run_sweep_button)
+        sweep_layout.addLayout(sweep_inputs)
+
+        sweep_figure, sweep_canvas = figure_canvas()
+        sweep_layout.addWidget(sweep_canvas)
+        run_sweep_button.clicked.connect(
+            lambda: self.start_sweep(quanta_input.text(), scales_input.text(), sweep_figure, sweep_canvas))
+        tabs.addTab(sweep_tab, "Quantum Sweep")
+
+        layout.addWidget(tabs)
         dialog.setLayout(layout)
 
         dialog.exec()
 
+    def start_sweep(self, quanta_text, scales_text, figure, canvas):
+        try:
+            time_quanta = [float(value) for value in quanta_text.split(",") if value.strip()]
+            arrival_scales = [float(value) for value in scales_text.split(",") if value.strip()]
+        except ValueError:
+            QMessageBox.warning(self, "Error", "Quanta and arrival rate scales must be comma-separated numbers.")
+            return
+        if not time_quanta or not arrival_scales or min(time_quanta + arrival_scales) <= 0:
+            QMessageBox.warning(self, "Error", "Quanta and arrival rate scales must be positive.")
+            return
+
+        workload = Workload.from_processes(self.get_process_data())
+        self.run_in_background(sweep_round_robin, lambda points: self.plot_sweep(points, figure, canvas),
+                               workload, time_quanta, arrival_scales)
+
+    def plot_sweep(self, points, figure, canvas):
+        figure.clear()
+        waiting_ax, turnaround_ax, switches_ax = figure.subplots(3, 1, sharex=True)
+        for arrival_scale in dict.fromkeys(point.arrival_scale for point in points):
+            series = sorted((point for point in points if point.arrival_scale == arrival_scale),
+                            key=lambda point: point.time_quantum)
+            quanta = [point.time_quantum for point in series]
+            label = f"arrival rate x{arrival_scale:g}"
+            waiting_ax.plot(quanta, [point.average_waiting_time for point in series], marker='o', label=label)
+            turnaround_ax.plot(quanta, [point.average_turnaround_time for point in series], marker='o', label=label)
+            switches_ax.plot(quanta, [point.context_switches for point in series], marker='o', label=label)
+        waiting_ax.set_ylabel('Avg Waiting')
+        turnaround_ax.set_ylabel('Avg Turnaround')
+        switches_ax.set_ylabel('Context Switches')
+        switches_ax.set_xlabel('Time Quantum')
+        waiting_ax.set_title('Round Robin Quantum Sweep')
+        waiting_ax.legend()
+        figure.tight_layout()
+        canvas.draw()
+
     def open_file_dialog(self):
         options = QFileDialog.Options()
         file_name, _ = QFileDialog.getOpenFileName(self, "Open Python File", "", "Python Files (*.py)", options=options)
@@ -185,34 +588,126 @@ class Scheduler(QWidget):
 
 
 
+    def save_schedule(self):
+        if not self.gantt_chart.lanes or self.schedule_source is None:
+            QMessageBox.warning(self, "Error", "Run a schedule before saving it.")
+            return
+        file_name, _ = QFileDialog.getSaveFileName(self, "Save Schedule", "", "Schedule Files (*.sched)")
+        if file_name:
+            self.run_in_background(save_schedule_file, lambda _: None, file_name, self.schedule_source)
+
+    def open_schedule(self):
+        file_name, _ = QFileDialog.getOpenFileName(self, "Open Schedule", "", "Schedule Files (*.sched)")
+        if file_name:
+            self.requested_source = file_name
+            self.run_in_background(load_schedule_file, self.show_saved_schedule, file_name)
+
+    def show_saved_schedule(self, lanes):
+        self.schedule_source = self.requested_source
+        self.gantt_chart.set_lanes(lanes)
+        self.total_time_label.setText(f"Total Time: {schedule_span(lanes):.2f}")
+        self.average_waiting_time_label.setText("Average Waiting Time: n/a")
+        self.utilization_label.hide()
+        self.metrics_label.hide()
+        self.profile_label.hide()
+        self.gantt_chart.start_simulation()
+
     def start_scheduling(self):
-        processes = self.get_process_data()
-        self.compute_average_waiting_times()  # Calculate average waiting times for all algorithms
+        workload = Workload.from_processes(self.get_process_data())
         algorithm = self.algorithm_select.currentText()
-        schedule, timestamps, _, waiting_times = [], [], {}, []
-        
-        if algorithm == "FCFS":
-            schedule, timestamps, _, waiting_times = fcfs(processes)
-        elif algorithm == "Round Robin":
-            time_quantum = float(self.quantum_input.text())
-            schedule, timestamps, _, waiting_times = round_robin(processes, time_quantum)
-        elif algorithm == "SRTF":
-            schedule, timestamps, _, waiting_times = srtf(processes)
-        elif algorithm == "Priority Scheduling":
-            schedule, timestamps, _, waiting_times = priority_scheduling(processes)
-
-        self.gantt_chart.set_schedule(schedule, timestamps)
-        avg_waiting_time = sum(wt for _, wt in waiting_times) / len(waiting_times)
-        self.average_waiting_time_label.setText(f"Average Waiting Time: {avg_waiting_time:.2f}")
-        self.total_time_label.setText(f"Total Time: {timestamps[-1] - timestamps[0]:.2f}")
-        self.gantt_chart.start_simulation(interval=1000)
+        try:
+            time_quantum = float(self.quantum_input.text()) if algorithm in QUANTUM_ALGORITHMS else None
+        except ValueError:
+            QMessageBox.warning(self, "Error", f"Please enter a time quantum for {algorithm}.")
+            return
+
+        mode = "partitioned" if self.partitioned_check.isChecked() else "global"
+        cores = self.cores_input.value() if self.cores_input.isEnabled() else 1
+        self.requested_source = (workload, algorithm, time_quantum, cores, mode)
+        self.run_in_background(simulate_workload, self.show_schedule, workload, algorithm, time_quantum, cores, mode,
+                               self.comparison_quantum(), self.simulation_cache,
+                               self.profile_check.isEnabled() and self.profile_check.isChecked())
 
+    def show_schedule(self, result):
+        lanes, waiting_times, utilization, metrics, self.comparison_results, engine_profile = result
+        self.schedule_source = self.requested_source
+        self.average_waiting_times = {result.label: result.average_waiting_time for result in self.comparison_results}
 
-        self.gantt_chart.set_schedule(schedule, timestamps)
-        avg_waiting_time = sum(wt for _, wt in waiting_times) / len(waiting_times)
+        self.gantt_chart.set_lanes(lanes)
+        avg_waiting_time = sum(wt for _, wt in waiting_times) / len(waiting_times) if waiting_times else 0.0
         self.average_waiting_time_label.setText(f"Average Waiting Time: {avg_waiting_time:.2f}")
-        self.total_time_label.setText(f"Total Time: {timestamps[-1] - timestamps[0]:.2f}")
-        self.gantt_chart.start_simulation(interval=1000)
+        self.total_time_label.setText(f"Total Time: {schedule_span(lanes):.2f}")
+        if utilization is None:
+            self.utilization_label.hide()
+        else:
+            self.utilization_label.setText("CPU Utilization: " + ", ".join(
+                f"CPU {i} {fraction:.0%}" for i, fraction in enumerate(utilization)))
+            self.utilization_label.show()
+        self.show_metrics(metrics)
+        self.show_engine_profile(engine_profile)
+        self.gantt_chart.start_simulation()
+
+    def show_metrics(self, metrics):
+        lines = [f"{name.capitalize():<11} " + "  ".join(
+            f"{statistic} {metrics[f'{name}_{statistic}']:.2f}" for statistic in ("mean", "p50", "p95", "p99", "max"))
+            for name in ("turnaround", "waiting", "response", "slowdown")]
+        lines.append(f"Context switches {metrics['context_switches']}  "
+                     f"utilization {metrics['utilization']:.0%}  throughput {metrics['throughput']:.2f} jobs/unit")
+        self.metrics_label.setText("\n".join(lines))
+        self.metrics_label.show()
+
+    def show_engine_profile(self, report):
+        if report is None:
+            self.profile_label.hide()
+            return
+        total_seconds = sum(report[f"{phase}_seconds"] for phase in PHASES)
+        self.profile_label.setText("\n".join([
+            f"Dispatches {report['dispatches']}  preemptions {report['preemptions']}  "
+            f"completions {report['completions']}  idle gaps {report['idle_gaps']}",
+            f"Ready queue mean {report['queue_length_mean']:.2f}  p95 {report['queue_length_p95']}  "
+            f"max {report['queue_length_max']}",
+            f"Time {total_seconds * 1000:.1f} ms: " + "  ".join(
+                f"{phase} {report[f'{phase}_seconds'] * 1000:.1f}" for phase in PHASES),
+        ]))
+        self.profile_label.show()
+
+    def seek_playback(self, value):
+        self.gantt_chart.seek(value / self.SLIDER_STEPS * self.gantt_chart.end_time)
+
+    def show_playback_position(self, time):
+        if not self.position_slider.isSliderDown():
+            self.position_slider.setValue(int(time / self.gantt_chart.total_duration() * self.SLIDER_STEPS))
+
+    def run_in_background(self, fn, on_result, *args):
+        self.cancel_background()
+        worker = Worker(fn, *args)
+        worker.signals.progress.connect(self.show_progress)
+        worker.signals.result.connect(on_result)
+        worker.signals.error.connect(self.show_worker_error)
+        worker.signals.finished.connect(lambda: self.worker_finished(worker))
+        self.active_worker = worker
+        self.progress_bar.setRange(0, 0)
+        self.progress_bar.show()
+        self.cancel_button.show()
+        self.thread_pool.start(worker)
+
+    def cancel_background(self):
+        if self.active_worker is not None:
+            self.active_worker.cancel()
+            self.worker_finished(self.active_worker)
+
+    def worker_finished(self, worker):
+        if worker is self.active_worker:
+            self.active_worker = None
+            self.progress_bar.hide()
+            self.cancel_button.hide()
+
+    def show_progress(self, done, total):
+        self.progress_bar.setRange(0, total)
+        self.progress_bar.setValue(done)
+
+    def show_worker_error(self, message):
+        QMessageBox.critical(self, "Error", message)
 
     def add_process(self):
         row_position = self.process_table.rowCount()
@@ -240,53 +735,36 @@ class Scheduler(QWidget):
             processes.append((name, arrival_time, cpu_burst, priority))
         return processes
 
-    def compute_average_waiting_times(self):
-        processes = self.get_process_data()
-
-        self.average_waiting_times = {}
-
-        _, _, _, waiting_times = fcfs(processes)
-        self.average_waiting_times["FCFS"] = sum([wt for _, wt in waiting_times]) / len(waiting_times)
-
+    def comparison_quantum(self):
         try:
-            time_quantum = float(self.quantum_input.text()) if self.quantum_input.text() else 2
+            return float(self.quantum_input.text()) if self.quantum_input.text() else 2
         except ValueError:
-            time_quantum = 2  # Default value
-        _, _, _, waiting_times = round_robin(processes, time_quantum)
-        self.average_waiting_times["Round Robin"] = sum([wt for _, wt in waiting_times]) / len(waiting_times)
+            return 2  # Default value
 
-        _, _, _, waiting_times = srtf(processes)
-        self.average_waiting_times["SRTF"] = sum([wt for _, wt in waiting_times]) / len(waiting_times)
+    def compute_average_waiting_times(self, on_done=None):
+        workload = Workload.from_processes(self.get_process_data())
 
-        _, _, _, waiting_times = priority_scheduling(processes)
-        self.average_waiting_times["Priority Scheduling"] = sum([wt for _, wt in waiting_times]) / len(waiting_times)
+        def store_results(comparison_results):
+            self.comparison_results = comparison_results
+            self.average_waiting_times = {result.label: result.average_waiting_time for result in comparison_results}
+            if on_done:
+                on_done()
 
+        self.run_in_background(compare_algorithms, store_results, workload, None, [self.comparison_quantum()],
+                               None, self.simulation_cache)
 
     def load_threads_from_file(self, file_path):
-        try:
-            spec = importlib.util.spec_from_file_location("module.name", file_path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-            if hasattr(module, 'run_threads') and callable(module.run_threads):
+        self.run_in_background(profile_file, self.fill_process_table, file_path, None)
 
-                execution_times = module.run_threads()
+    def fill_process_table(self, trace):
+        self.process_table.setRowCount(len(trace))
+        for i, (process_name, arrival_time, cpu_burst, priority) in enumerate(trace):
+            self.process_table.setItem(i, 0, QTableWidgetItem(process_name))
+            self.process_table.setItem(i, 1, QTableWidgetItem(f"{arrival_time:.3f}"))
+            self.process_table.setItem(i, 2, QTableWidgetItem(f"{cpu_burst:.3f}"))
+            self.process_table.setItem(i, 3, QTableWidgetItem(str(priority)))
 
-                if isinstance(execution_times, dict):
-                    self.process_table.setRowCount(len(execution_times))
-                    for i, (process_name, exec_time) in enumerate(execution_times.items()):
-                        self.process_table.setItem(i, 0, QTableWidgetItem(process_name))
-                        self.process_table.setItem(i, 1, QTableWidgetItem(str(i))) 
-                        self.process_table.setItem(i, 2, QTableWidgetItem(f"{exec_time:.2f}"))  
-
-
-                    self.compute_average_waiting_times()
-
-                else:
-                    QMessageBox.warning(self, "Error", "Invalid thread execution times format in the file.")
-            else:
-                QMessageBox.warning(self, "Error", "The file does not have a 'run_threads' function to execute the threads.")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load file: {str(e)}")
+        self.compute_average_waiting_times()
 
     def clear_table(self):
         """Clears all rows from the process table."""
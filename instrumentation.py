@@ -0,0 +1,137 @@
+import time
+from collections import Counter, deque
+
+from algorithms import _as_processes
+from compare import stream_algorithm
+
+PHASES = ("input", "engine", "consumer")
+PROFILE_FIELDS = ["dispatches", "preemptions", "completions", "idle_gaps", "queue_length_mean", "queue_length_p95",
+                  "queue_length_max"] + [f"{phase}_seconds" for phase in PHASES]
+
+
+class EngineProfile:
+    """Opt-in instrumentation for the *_segments engines.
+
+    The profile wraps an engine's job input (observe_jobs) and segment output (observe) rather
+    than hooking into the engines, so an unwrapped schedule pays nothing for it. It counts
+    dispatches (the running job changes), preemptions (an unfinished job is followed by a different
+    one), completions and idle gaps, keeps a histogram of the ready-queue length at each dispatch
+    plus a bounded (time, length) series, and splits wall time into reading jobs (input),
+    scheduling decisions (engine) and whatever consumes the segments (consumer).
+
+    callback(job, start_time, duration, finished, queue_length) is called for every segment.
+    Pass the sorted arrival times when they are known up front; otherwise they are taken from
+    observe_jobs, which is exact for every engine that looks one job ahead (all but FCFS).
+    """
+
+    MAX_SAMPLES = 4096
+
+    def __init__(self, callback=None, arrivals=None):
+        self.callback = callback
+        self.dispatches = 0
+        self.preemptions = 0
+        self.completions = 0
+        self.idle_gaps = 0
+        self.queue_lengths = Counter()
+        self.samples = []
+        self.sample_stride = 1
+        self.phase_times = dict.fromkeys(PHASES, 0.0)
+        self.known_arrivals = arrivals is not None
+        self.arrivals = deque(arrivals or ())
+        self.arrived = 0
+        self.segments = 0
+        self.running = None  # name of the job holding the CPU, None when idle or after a completion
+
+    def observe_jobs(self, jobs):
+        """Pass jobs through, timing how long it takes to produce them."""
+        clock = time.perf_counter
+        jobs = iter(jobs)
+        while True:
+            start_time = clock()
+            job = next(jobs, None)
+            self.phase_times["input"] += clock() - start_time
+            if job is None:
+                return
+            if not self.known_arrivals:
+                self.arrivals.append(job[1])
+            yield job
+
+    def observe(self, segments):
+        """Yield the engine's segments, counting dispatches and charging the time spent in next() to the engine."""
+        clock = time.perf_counter
+        segments = iter(segments)
+        while True:
+            input_time = self.phase_times["input"]
+            start_time = clock()
+            segment = next(segments, None)
+            # Reading jobs happens inside the engine's next(), so it is taken back out of the engine phase.
+            self.phase_times["engine"] += clock() - start_time - (self.phase_times["input"] - input_time)
+            if segment is None:
+                return
+            self.add_segment(*segment)
+            start_time = clock()
+            yield segment
+            self.phase_times["consumer"] += clock() - start_time
+
+    def add_segment(self, job, start_time, duration, finished):
+        self.segments += 1
+        if job is None:
+            self.idle_gaps += 1
+            self.running = None
+            queue_length = 0
+        else:
+            while self.arrivals and self.arrivals[0] <= start_time:
+                self.arrivals.popleft()
+                self.arrived += 1
+            queue_length = self.arrived - self.completions - 1
+            # Engines split the running job's segment at arrivals it survives; that is not a dispatch.
+            if job[0] != self.running:
+                if self.running is not None:
+                    self.preemptions += 1
+                self.dispatches += 1
+                self.queue_lengths[queue_length] += 1
+                if self.dispatches % self.sample_stride == 0:
+                    self.samples.append((start_time, queue_length))
+                    if len(self.samples) > self.MAX_SAMPLES:
+                        del self.samples[1::2]
+                        self.sample_stride *= 2
+            if finished:
+                self.completions += 1
+                self.running = None
+            else:
+                self.running = job[0]
+        if self.callback:
+            self.callback(job, start_time, duration, finished, queue_length)
+
+    def queue_length_percentile(self, percentile):
+        rank = percentile / 100 * sum(self.queue_lengths.values())
+        seen = 0
+        for length in sorted(self.queue_lengths):
+            seen += self.queue_lengths[length]
+            if seen >= rank:
+                return length
+        return 0
+
+    def report(self):
+        dispatches = sum(self.queue_lengths.values())
+        report = {
+            "dispatches": self.dispatches,
+            "preemptions": self.preemptions,
+            "completions": self.completions,
+            "idle_gaps": self.idle_gaps,
+            "queue_length_mean": sum(length * count for length, count in self.queue_lengths.items()) / dispatches
+            if dispatches else 0.0,
+            "queue_length_p95": self.queue_length_percentile(95),
+            "queue_length_max": max(self.queue_lengths, default=0),
+        }
+        for phase, seconds in self.phase_times.items():
+            report[f"{phase}_seconds"] = seconds
+        return report
+
+
+def profile_algorithm(processes, algorithm, time_quantum=None, callback=None):
+    """Run one algorithm under an EngineProfile, draining its segments without keeping them."""
+    jobs = sorted(_as_processes(processes), key=lambda p: p[1])
+    profile = EngineProfile(callback, arrivals=[job[1] for job in jobs])
+    deque(profile.observe(stream_algorithm(profile.observe_jobs(jobs), algorithm, time_quantum)), maxlen=0)
+    return profile
@@ -0,0 +1,158 @@
+import heapq
+import math
+
+PERCENTILES = (50, 95, 99)
+LATENCIES = ("turnaround", "waiting", "response", "slowdown")
+METRIC_FIELDS = ["jobs", "context_switches", "utilization", "throughput"] + [
+    f"{latency}_{statistic}" for latency in LATENCIES
+    for statistic in ["mean"] + [f"p{percentile}" for percentile in PERCENTILES] + ["max"]
+]
+
+
+class LatencyHistogram:
+    """Log-bucketed histogram whose quantiles are within relative_accuracy of the exact value.
+
+    Bucket i holds values in (gamma ** (i - 1), gamma ** i], so memory grows with the
+    log of the value range rather than with the number of samples.
+    """
+
+    def __init__(self, relative_accuracy=0.01):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.buckets = {}
+        self.zero_count = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value):
+        self.count += 1
+        self.total += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        if value <= 0:
+            self.zero_count += 1
+            return
+        index = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    def mean(self):
+        return self.total / self.count if self.count else 0.0
+
+    def quantile(self, q):
+        if not self.count:
+            return 0.0
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return min(max(0.0, self.min), self.max)
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                value = 2 * self.gamma ** index / (self.gamma + 1)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    def summary(self, prefix):
+        summary = {f"{prefix}_mean": self.mean()}
+        for percentile in PERCENTILES:
+            summary[f"{prefix}_p{percentile}"] = self.quantile(percentile / 100)
+        summary[f"{prefix}_max"] = self.max if self.count else 0.0
+        return summary
+
+
+class ScheduleMetrics:
+    """Per-job latency distributions and CPU counters collected from a segment stream.
+
+    Only jobs that have started but not finished are remembered, so a run of any length
+    needs memory proportional to its ready queue, not to its job count. Total time runs
+    from the first arrival to the last completion; idle segments are ignored.
+    """
+
+    def __init__(self, cores=1, relative_accuracy=0.01):
+        self.cores = cores
+        self.latencies = {latency: LatencyHistogram(relative_accuracy) for latency in LATENCIES}
+        self.first_start = {}
+        self.previous = {}
+        self.context_switches = 0
+        self.busy_time = 0.0
+        self.start_time = math.inf
+        self.end_time = -math.inf
+
+    def add_segment(self, job, start_time, duration, finished, core=0):
+        if job is None:
+            return
+
+        end_time = start_time + duration
+        self.start_time = min(self.start_time, job[1])
+        self.end_time = max(self.end_time, end_time)
+        self.busy_time += duration
+        previous = self.previous.get(core)
+        if previous is not None and previous != job[0]:
+            self.context_switches += 1
+        self.previous[core] = job[0]
+
+        first_start = self.first_start.setdefault(id(job), start_time)
+        if finished:
+            del self.first_start[id(job)]
+            arrival, burst = job[1], job[2]
+            turnaround = end_time - arrival
+            self.latencies["turnaround"].add(turnaround)
+            self.latencies["waiting"].add(turnaround - burst)
+            self.latencies["response"].add(first_start - arrival)
+            self.latencies["slowdown"].add(turnaround / burst if burst > 0 else 1.0)
+
+    def observe(self, segments):
+        """Yield the segments unchanged, folding each finished job into the latency histograms."""
+        for segment in segments:
+            self.add_segment(*segment)
+            yield segment
+
+    def total_time(self):
+        return self.end_time - self.start_time if self.end_time > self.start_time else 0.0
+
+    def report(self):
+        total_time = self.total_time()
+        jobs = self.latencies["turnaround"].count
+        report = {
+            "jobs": jobs,
+            "context_switches": self.context_switches,
+            "utilization": self.busy_time / (total_time * self.cores) if total_time else 0.0,
+            "throughput": jobs / total_time if total_time else 0.0,
+        }
+        for latency, histogram in self.latencies.items():
+            report.update(histogram.summary(latency))
+        return report
+
+
+def lane_segments(processes, lanes):
+    """Replay (schedule, timestamps) lanes as (job, start, duration, finished, core) in start order.
+
+    Idle segments are skipped; a job finishes with the last segment it runs in any lane.
+    """
+    jobs = {process[0]: tuple(process[:4]) for process in processes}
+
+    def busy_segments(core, schedule, timestamps):
+        for index, ((name, duration), start_time) in enumerate(zip(schedule, timestamps)):
+            if name != "Idle":
+                yield start_time, core, index, name, duration
+
+    last_segment = {}
+    for core, lane in enumerate(lanes):
+        for start_time, _, index, name, _ in busy_segments(core, *lane):
+            if (start_time, core, index) > last_segment.get(name, (-math.inf,)):
+                last_segment[name] = (start_time, core, index)
+
+    merged = heapq.merge(*(busy_segments(core, *lane) for core, lane in enumerate(lanes)))
+    for start_time, core, index, name, duration in merged:
+        yield jobs[name], start_time, duration, last_segment[name] == (start_time, core, index), core
+
+
+def schedule_metrics(processes, lanes):
+    metrics = ScheduleMetrics(cores=len(lanes))
+    for segment in lane_segments(processes, lanes):
+        metrics.add_segment(*segment)
+    return metrics.report()
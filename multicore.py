@@ -0,0 +1,290 @@
+import heapq
+import math
+from collections import deque
+
+from algorithms import _EPSILON, _as_processes, _check_time_quantum, _quanta_to_reach, _waiting_times
+
+MODES = ("global", "partitioned")
+
+
+class _Job:
+    __slots__ = ("name", "arrival", "priority", "remaining")
+
+    def __init__(self, name, arrival, burst, priority):
+        self.name = name
+        self.arrival = arrival
+        self.priority = priority
+        self.remaining = burst
+
+
+class _FifoQueue:
+    def __init__(self):
+        self.items = deque()
+        self.work = 0.0
+
+    def push(self, job):
+        self.items.append(job)
+        self.work += job.remaining
+
+    def pop(self):
+        job = self.items.popleft()
+        self.work -= job.remaining
+        return job
+
+    def peek(self):
+        return self.items[0]
+
+    def __len__(self):
+        return len(self.items)
+
+
+class _HeapQueue:
+    def __init__(self, key):
+        self.key = key
+        self.items = []
+        self.seq = 0
+        self.waiting_seq = 0
+        self.requeued = 0
+        self.work = 0.0
+
+    def mark_waiting(self, reserved):
+        # Jobs pushed before this point were already waiting when the current arrivals came in; the
+        # next `reserved` sequence numbers are kept for running jobs requeued ahead of the arrivals.
+        self.waiting_seq = self.seq
+        self.requeued = 0
+        self.seq += reserved
+
+    def push(self, job):
+        heapq.heappush(self.items, (self.key(job), self.seq, job))
+        self.seq += 1
+        self.work += job.remaining
+
+    def requeue(self, job):
+        heapq.heappush(self.items, (self.key(job), self.waiting_seq + self.requeued, job))
+        self.requeued += 1
+        self.work += job.remaining
+
+    def pop(self):
+        job = heapq.heappop(self.items)[2]
+        self.work -= job.remaining
+        return job
+
+    def peek(self):
+        return self.items[0][2]
+
+    def __len__(self):
+        return len(self.items)
+
+
+def _remaining_time(job):
+    return round(job.remaining, 9)
+
+
+def _priority(job):
+    return job.priority
+
+
+POLICY_KEYS = {
+    "FCFS": None,
+    "Round Robin": None,
+    "SRTF": _remaining_time,
+    "Priority Scheduling": _priority,
+}
+
+
+class _Core:
+    __slots__ = ("job", "queue", "segment_start", "finish_time", "slice_end", "idle_since",
+                 "busy_time", "schedule", "timestamps")
+
+    def __init__(self, queue):
+        self.job = None
+        self.queue = queue
+        self.segment_start = 0.0
+        self.finish_time = math.inf
+        self.slice_end = math.inf
+        self.idle_since = 0.0
+        self.busy_time = 0.0
+        self.schedule = []
+        self.timestamps = []
+
+
+class _MulticoreSimulation:
+    def __init__(self, processes, algorithm, cores, mode, time_quantum):
+        if algorithm not in POLICY_KEYS:
+            raise ValueError(f"Unknown algorithm: {algorithm}")
+        if cores < 1:
+            raise ValueError("At least one core is required")
+        if mode not in MODES:
+            raise ValueError(f"Unknown mode: {mode}")
+        if algorithm == "Round Robin":
+            _check_time_quantum(time_quantum)
+
+        self.key = POLICY_KEYS[algorithm]
+        self.time_quantum = time_quantum if algorithm == "Round Robin" else None
+        self.partitioned = mode == "partitioned"
+        self.jobs = [_Job(*p[:4]) for p in processes]
+        self.cursor = 0
+        self.completion_times = {}
+
+        if self.partitioned:
+            self.cores = [_Core(self.new_queue()) for _ in range(cores)]
+        else:
+            shared_queue = self.new_queue()
+            self.cores = [_Core(shared_queue) for _ in range(cores)]
+        self.queues = list({id(core.queue): core.queue for core in self.cores}.values())
+
+    def new_queue(self):
+        return _HeapQueue(self.key) if self.key else _FifoQueue()
+
+    def start(self, core, job, time):
+        if core.idle_since < time:
+            core.timestamps.append(core.idle_since)
+            core.schedule.append(("Idle", time - core.idle_since))
+        core.job = job
+        core.segment_start = time
+        core.finish_time = time + job.remaining
+        core.slice_end = time + self.time_quantum if self.time_quantum else math.inf
+
+    def stop(self, core, time):
+        job = core.job
+        job.remaining = core.finish_time - time
+        if time > core.segment_start or job.remaining <= 0:
+            core.timestamps.append(core.segment_start)
+            core.schedule.append((job.name, time - core.segment_start))
+        core.busy_time += time - core.segment_start
+        core.job = None
+        core.finish_time = math.inf
+        core.slice_end = math.inf
+        core.idle_since = time
+        return job
+
+    def load(self, core, time):
+        running = core.finish_time - time if core.job else 0.0
+        return core.queue.work + running
+
+    def admit(self, job, time):
+        if self.partitioned:
+            min(self.cores, key=lambda core: self.load(core, time)).queue.push(job)
+        else:
+            self.queues[0].push(job)
+
+    def next_job(self, core):
+        if core.queue:
+            return core.queue.pop()
+        if self.partitioned:
+            victim = max(self.cores, key=lambda other: len(other.queue))
+            if victim.queue:
+                return victim.queue.pop()
+        return None
+
+    def expire_slices(self, time):
+        next_arrival = self.jobs[self.cursor].arrival if self.cursor < len(self.jobs) else math.inf
+        for core in self.cores:
+            if core.job is None or core.slice_end > time + _EPSILON:
+                continue
+            if core.queue:
+                core.queue.push(self.stop(core, time))
+            elif next_arrival == math.inf:
+                core.slice_end = math.inf
+            else:
+                quanta = max(1, _quanta_to_reach(next_arrival - core.slice_end, self.time_quantum))
+                core.slice_end += quanta * self.time_quantum
+
+    def outranks(self, queue, core, time, arrived):
+        # Like the single-core engine, which requeues the running job at every arrival ahead of the
+        # newcomers: on a tied key a job that was already running yields only to jobs that were
+        # already waiting. A job dispatched at this instant already won its tie in the heap.
+        key, seq, _ = queue.items[0]
+        running_key = self.key(core.job)
+        if key != running_key:
+            return key < running_key
+        return arrived and core.segment_start < time and seq < queue.waiting_seq
+
+    def requeue(self, queue, core, time, arrived):
+        was_running = core.segment_start < time
+        job = self.stop(core, time)
+        if arrived and was_running:
+            queue.requeue(job)
+        else:
+            queue.push(job)
+
+    def preempt(self, time, arrived):
+        running = [core for core in self.cores if core.job]
+        for core in running:
+            core.job.remaining = core.finish_time - time
+        if self.partitioned:
+            for core in running:
+                if core.queue and self.outranks(core.queue, core, time, arrived):
+                    self.requeue(core.queue, core, time, arrived)
+                    self.start(core, core.queue.pop(), time)
+            return
+        queue = self.queues[0]
+        while queue and running:
+            worst = max(running, key=lambda core: (self.key(core.job), core.segment_start < time))
+            if not self.outranks(queue, worst, time, arrived):
+                break
+            self.requeue(queue, worst, time, arrived)
+            self.start(worst, queue.pop(), time)
+
+    def run(self):
+        jobs = self.jobs
+        time = 0.0
+        while True:
+            for core in self.cores:
+                if core.job and core.finish_time <= time + _EPSILON:
+                    self.completion_times[core.job.name] = time
+                    self.stop(core, time)
+
+            arrived = self.cursor < len(jobs) and jobs[self.cursor].arrival <= time + _EPSILON
+            if self.key:
+                for queue in self.queues:
+                    queue.mark_waiting(len(self.cores))
+            while self.cursor < len(jobs) and jobs[self.cursor].arrival <= time + _EPSILON:
+                self.admit(jobs[self.cursor], time)
+                self.cursor += 1
+
+            if self.time_quantum:
+                self.expire_slices(time)
+
+            for core in self.cores:
+                if core.job is None:
+                    job = self.next_job(core)
+                    if job:
+                        self.start(core, job, time)
+
+            if self.key:
+                self.preempt(time, arrived)
+
+            next_arrival = jobs[self.cursor].arrival if self.cursor < len(jobs) else math.inf
+            next_time = min([next_arrival] + [min(core.finish_time, core.slice_end) for core in self.cores])
+            if next_time == math.inf:
+                break
+            time = next_time
+
+        for core in self.cores:
+            if core.idle_since < time:
+                core.timestamps.append(core.idle_since)
+                core.schedule.append(("Idle", time - core.idle_since))
+            core.timestamps.append(time)
+        return time
+
+
+def simulate_multicore(processes, algorithm, cores, mode="global", time_quantum=None, rounded=True):
+    """Simulate an algorithm on several identical cores.
+
+    mode "global" shares one ready queue between all cores; "partitioned" gives each core
+    its own queue, places arriving jobs on the least-loaded core and lets idle cores steal.
+    Returns (lanes, completion_times, waiting_times, utilization), with one
+    (schedule, timestamps) lane and one utilization fraction per core. Timestamps are rounded
+    to 2 decimals for display unless rounded is False.
+    """
+    processes = _as_processes(processes)
+    processes.sort(key=lambda x: x[1])
+    simulation = _MulticoreSimulation(processes, algorithm, cores, mode, time_quantum)
+    end_time = simulation.run()
+
+    lanes = [(core.schedule, [round(time, 2) for time in core.timestamps] if rounded else core.timestamps)
+             for core in simulation.cores]
+    utilization = [core.busy_time / end_time if end_time else 0.0 for core in simulation.cores]
+    waiting_times = _waiting_times(processes, simulation.completion_times)
+    return lanes, simulation.completion_times, waiting_times, utilization
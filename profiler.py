@@ -0,0 +1,160 @@
+import argparse
+import csv
+import importlib.util
+import multiprocessing
+import os
+import sys
+import time
+
+TRACE_FIELDS = ["name", "arrival", "burst", "priority"]
+
+_tasks = None
+
+
+def load_module(file_path):
+    spec = importlib.util.spec_from_file_location("workload_module", file_path)
+    if spec is None:
+        raise ValueError("Workload files must be Python source files.")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_tasks(file_path):
+    module = load_module(file_path)
+    if not (hasattr(module, "tasks") and callable(module.tasks)):
+        return module, None
+    tasks = module.tasks()
+    if not isinstance(tasks, dict):
+        raise ValueError("tasks() must return a dict mapping process names to callables.")
+    table = {}
+    for name, task in tasks.items():
+        arrival, fn, *rest = task if isinstance(task, tuple) else (0.0, task)
+        if not callable(fn):
+            raise ValueError(f"Task {name} is not callable.")
+        table[str(name)] = (float(arrival), fn, int(rest[0]) if rest else 0)
+    return module, table
+
+
+def _init_worker(file_path):
+    global _tasks
+    _, _tasks = _load_tasks(file_path)
+
+
+def _measure(name):
+    fn = _tasks[name][1]
+    start = time.process_time_ns()
+    fn()
+    return name, round((time.process_time_ns() - start) / 1e9, 6)
+
+
+def _probe(file_path):
+    # Runs in a spawned child, so the file's top-level code never executes in the caller. Older
+    # workload files time their own threads, so their run_threads() is called right here.
+    module, table = _load_tasks(file_path)
+    if table is not None:
+        return {name: (arrival, priority) for name, (arrival, _, priority) in table.items()}, None
+    if not (hasattr(module, "run_threads") and callable(module.run_threads)):
+        raise ValueError("The file needs a 'tasks' function (or a legacy 'run_threads' function).")
+    execution_times = module.run_threads()
+    if not isinstance(execution_times, dict):
+        raise ValueError("Invalid thread execution times format in the file.")
+    return None, execution_times
+
+
+def _probe_file(file_path, progress=None):
+    pool = multiprocessing.get_context("spawn").Pool(1)
+    try:
+        pending = pool.apply_async(_probe, (file_path,))
+        while not pending.ready():
+            if progress:
+                progress(0, 0)
+            pending.wait(0.1)
+        return pending.get()
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def profile_file(file_path, workers=None, progress=None):
+    """Run every task of a workload file in its own worker process and return the measured trace.
+
+    The file defines tasks() returning {name: fn}, {name: (arrival, fn)} or {name: (arrival, fn, priority)}.
+    Each task is submitted to a spawn-based process pool once `arrival` seconds have passed, so its
+    arrival is the real submission offset and its burst is the CPU time (time.process_time) it used in
+    its worker, free of GIL contention with the other tasks. Returns (name, arrival, burst, priority)
+    rows ordered by arrival. The file is first loaded in a single worker process to read its tasks; a
+    legacy file's run_threads() runs there instead, with rows kept in its order as arrival times.
+    progress(done, total) is called while waiting; an exception raised from it terminates the workers.
+    """
+    tasks, execution_times = _probe_file(file_path, progress)
+    if tasks is None:
+        return [(str(name), float(i), float(burst), 0) for i, (name, burst) in enumerate(execution_times.items())]
+    if not tasks:
+        return []
+
+    order = sorted(tasks, key=lambda name: tasks[name][0])
+    workers = workers or min(len(tasks), os.cpu_count() or 1)
+    pool = multiprocessing.get_context("spawn").Pool(workers, initializer=_init_worker, initargs=(file_path,))
+    try:
+        arrivals = {}
+        pending = []
+        start = time.perf_counter()
+        for name in order:
+            while True:
+                delay = tasks[name][0] - (time.perf_counter() - start)
+                if delay <= 0:
+                    break
+                if progress:
+                    progress(sum(result.ready() for result in pending), len(tasks))
+                time.sleep(min(delay, 0.1))
+            arrivals[name] = round(time.perf_counter() - start, 6)
+            pending.append(pool.apply_async(_measure, (name,)))
+
+        for result in pending:
+            while not result.ready():
+                if progress:
+                    progress(sum(result.ready() for result in pending), len(tasks))
+                result.wait(0.1)
+        bursts = dict(result.get() for result in pending)
+    finally:
+        pool.terminate()
+        pool.join()
+
+    return [(name, arrivals[name], bursts[name], tasks[name][1]) for name in order]
+
+
+def write_trace(file, rows):
+    writer = csv.writer(file)
+    writer.writerow(TRACE_FIELDS)
+    writer.writerows(rows)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m profiler",
+        description="Measure the arrival and CPU burst of every task in a workload file and write a CSV trace.",
+    )
+    parser.add_argument("file", help="Python file defining tasks()")
+    parser.add_argument("-j", "--jobs", type=int, help="worker processes (default: one per task, up to the CPU count)")
+    parser.add_argument("-o", "--output", default="-", help="trace output file (default: stdout)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        rows = profile_file(args.file, args.jobs)
+    except (OSError, ValueError) as e:
+        print(f"profiler: {args.file}: {e}", file=sys.stderr)
+        return 1
+    if args.output == "-":
+        write_trace(sys.stdout, rows)
+    else:
+        with open(args.output, "w", newline="") as file:
+            write_trace(file, rows)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
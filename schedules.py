@@ -0,0 +1,150 @@
+import json
+import struct
+
+import numpy as np
+
+MAGIC = b"SCHEDv1\0"
+HEADER = struct.Struct("<8sQQ")  # magic, segment count, footer offset
+SEGMENT_DTYPE = np.dtype([("process", "<i4"), ("start", "<f8"), ("duration", "<f8")])
+IDLE = -1
+
+
+class ScheduleWriter:
+    """Append schedule segments to a binary schedule file.
+
+    Segments are fixed-size (process id, start, duration) records after a small header; process
+    names are interned into a table that is written, with the lane boundaries, as a JSON footer
+    on close. The header is patched last, so a file is only readable once the writer is closed.
+    """
+
+    BUFFER_SEGMENTS = 65536
+
+    def __init__(self, path):
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, 0, 0))
+        self.names = []
+        self.ids = {}
+        self.lanes = [0]
+        self.buffer = []
+        self.count = 0
+
+    def process_id(self, name):
+        if name is None or name == "Idle":
+            return IDLE
+        process_id = self.ids.get(name)
+        if process_id is None:
+            process_id = self.ids[name] = len(self.names)
+            self.names.append(name)
+        return process_id
+
+    def append(self, process, start_time, duration):
+        self.buffer.append((self.process_id(process), start_time, duration))
+        if len(self.buffer) >= self.BUFFER_SEGMENTS:
+            self.flush()
+
+    def flush(self):
+        if self.buffer:
+            self.file.write(np.array(self.buffer, dtype=SEGMENT_DTYPE).tobytes())
+            self.count += len(self.buffer)
+            self.buffer.clear()
+
+    def new_lane(self):
+        """Start the next lane (e.g. the next simulated core); segments so far belong to the previous one."""
+        self.lanes.append(self.count + len(self.buffer))
+
+    def write_lane(self, schedule, timestamps):
+        for (process, duration), start_time in zip(schedule, timestamps):
+            self.append(process, start_time, duration)
+
+    def observe(self, segments):
+        """Yield the segments unchanged, appending each one (idle gaps included) to the file by process name."""
+        for segment in segments:
+            job, start_time, duration, _ = segment
+            self.append(None if job is None else job[0], start_time, duration)
+            yield segment
+
+    def close(self):
+        if self.file.closed:
+            return
+        self.flush()
+        footer_offset = self.file.tell()
+        self.file.write(json.dumps({"names": self.names, "lanes": self.lanes}).encode())
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, self.count, footer_offset))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ScheduleFile:
+    """Memory-mapped view of a binary schedule file.
+
+    process, start and duration are zero-copy column views over the mapped records, so any
+    segment range can be read without loading the rest of the file.
+    """
+
+    def __init__(self, path):
+        with open(path, "rb") as file:
+            header = file.read(HEADER.size)
+            if len(header) < HEADER.size or header[:len(MAGIC)] != MAGIC:
+                raise ValueError(f"Not a schedule file: {path}")
+            _, count, footer_offset = HEADER.unpack(header)
+            file.seek(footer_offset)
+            footer = json.loads(file.read())
+        self.names = footer["names"]
+        self.lane_starts = footer["lanes"]
+        if count:
+            self.segments = np.memmap(path, dtype=SEGMENT_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+        else:
+            self.segments = np.empty(0, dtype=SEGMENT_DTYPE)
+
+    @property
+    def process(self):
+        return self.segments["process"]
+
+    @property
+    def start(self):
+        return self.segments["start"]
+
+    @property
+    def duration(self):
+        return self.segments["duration"]
+
+    def __len__(self):
+        return len(self.segments)
+
+    def process_name(self, process_id):
+        return "Idle" if process_id == IDLE else self.names[process_id]
+
+    def lane_count(self):
+        return len(self.lane_starts)
+
+    def lane(self, index):
+        end = self.lane_starts[index + 1] if index + 1 < len(self.lane_starts) else len(self.segments)
+        return self.segments[self.lane_starts[index]:end]
+
+    def to_lanes(self):
+        """Rebuild the (schedule, timestamps) pairs the algorithms return, one per lane."""
+        names = np.array(self.names + ["Idle"], dtype=object)  # IDLE (-1) indexes the trailing "Idle"
+        lanes = []
+        for index in range(self.lane_count()):
+            segments = self.lane(index)
+            durations = segments["duration"].tolist()
+            schedule = list(zip(names[segments["process"]].tolist(), durations))
+            end_time = float(segments["start"][-1] + segments["duration"][-1]) if len(segments) else 0.0
+            timestamps = np.round(np.append(segments["start"], end_time), 2).tolist()
+            lanes.append((schedule, timestamps))
+        return lanes
+
+
+def write_schedule_file(path, lanes):
+    """Write (schedule, timestamps) lanes, as returned by the algorithms or the multi-core simulator."""
+    with ScheduleWriter(path) as writer:
+        for index, (schedule, timestamps) in enumerate(lanes):
+            if index:
+                writer.new_lane()
+            writer.write_lane(schedule, timestamps)
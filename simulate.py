@@ -0,0 +1,190 @@
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+from compare import ComparisonResult, comparison_variants, run_algorithm, stream_algorithm, summarize, summarize_segments
+from cache import SimulationCache, cache_key, workload_fingerprint
+from instrumentation import PROFILE_FIELDS, EngineProfile, profile_algorithm
+from metrics import METRIC_FIELDS, ScheduleMetrics, schedule_metrics
+from schedules import ScheduleWriter
+from traces import iter_jobs, load_workload
+
+ALGORITHM_NAMES = {
+    "fcfs": "FCFS",
+    "rr": "Round Robin",
+    "srtf": "SRTF",
+    "priority": "Priority Scheduling",
+    "sjf": "SJF",
+    "hrrn": "HRRN",
+    "mlfq": "MLFQ",
+    "stride": "Stride",
+    "aging": "Priority with Aging",
+}
+
+RESULT_FIELDS = ["trace"] + list(ComparisonResult._fields)
+LATENCY_FIELDS = [field for field in METRIC_FIELDS if field not in RESULT_FIELDS]
+
+
+SCHEDULE_EXTENSIONS = {"csv": "csv", "binary": "sched"}
+
+
+def schedule_file_name(trace, algorithm, time_quantum, schedule_format="csv"):
+    short_name = next(key for key, name in ALGORITHM_NAMES.items() if name == algorithm)
+    if time_quantum is not None:
+        short_name += f"-q{time_quantum:g}"
+    return f"{trace}.{short_name}.{SCHEDULE_EXTENSIONS[schedule_format]}"
+
+
+def _write_segments(file, segments):
+    writer = csv.writer(file)
+    writer.writerow(["process", "start", "duration"])
+    for segment in segments:
+        job, start_time, duration, _ = segment
+        writer.writerow(["Idle" if job is None else job[0], start_time, duration])
+        yield segment
+
+
+def _stream_variant(path, jobs, label, algorithm, time_quantum, schedule_dir, latency, schedule_format, profile):
+    """Summarize one variant from a single pass over its segments, writing the schedule on the way."""
+    trace = os.path.splitext(os.path.basename(path))[0]
+    engine_profile = EngineProfile() if profile else None
+    if engine_profile:
+        segments = engine_profile.observe(stream_algorithm(engine_profile.observe_jobs(jobs), algorithm, time_quantum))
+    else:
+        segments = stream_algorithm(jobs, algorithm, time_quantum)
+    metrics = ScheduleMetrics() if latency else None
+    if metrics:
+        segments = metrics.observe(segments)
+    schedule_path = schedule_dir and os.path.join(
+        schedule_dir, schedule_file_name(trace, algorithm, time_quantum, schedule_format))
+    if schedule_path and schedule_format == "binary":
+        with ScheduleWriter(schedule_path) as writer:
+            summary = summarize_segments(label, algorithm, time_quantum, writer.observe(segments))
+    elif schedule_path:
+        with open(schedule_path, "w", newline="") as file:
+            summary = summarize_segments(label, algorithm, time_quantum, _write_segments(file, segments))
+    else:
+        summary = summarize_segments(label, algorithm, time_quantum, segments)
+    row = {"trace": path, **summary._asdict()}
+    if metrics:
+        row.update(metrics.report())
+    if engine_profile:
+        row.update(engine_profile.report())
+    return row
+
+
+def stream_trace(path, variants, schedule_dir=None, latency=False, schedule_format="csv", profile=False):
+    return [_stream_variant(path, iter_jobs(path), label, algorithm, time_quantum, schedule_dir, latency,
+                            schedule_format, profile)
+            for label, algorithm, time_quantum in variants]
+
+
+def simulate_trace(path, variants, schedule_dir=None, cache_dir=None, latency=False, schedule_format="csv",
+                   profile=False):
+    workload = load_workload(path)
+    if schedule_dir:
+        # Writing the schedule needs every segment anyway, so the summary comes from the same pass
+        # (the trace is sorted in memory, unlike with --stream); there is nothing to reuse from a cache.
+        jobs = sorted(workload.to_processes(), key=lambda job: job[1])
+        return [_stream_variant(path, iter(jobs), label, algorithm, time_quantum, schedule_dir, latency,
+                                schedule_format, profile)
+                for label, algorithm, time_quantum in variants]
+    cache = SimulationCache(maxsize=len(variants), directory=cache_dir) if cache_dir else None
+    fingerprint = workload_fingerprint(workload) if cache else None
+    rows = []
+    for label, algorithm, time_quantum in variants:
+        if cache:
+            key = cache_key(fingerprint, "schedule", algorithm, time_quantum=time_quantum)
+            result = cache.get_or_compute(key, lambda: run_algorithm(workload, algorithm, time_quantum))
+        else:
+            result = run_algorithm(workload, algorithm, time_quantum)
+        summary = summarize(workload, label, algorithm, time_quantum, result)
+        row = {"trace": path, **summary._asdict()}
+        if latency:
+            row.update(schedule_metrics(workload.to_processes(), [(result[0], result[1])]))
+        if profile:
+            row.update(profile_algorithm(workload, algorithm, time_quantum).report())
+        rows.append(row)
+    return rows
+
+
+def _simulate_safely(path, variants, schedule_dir, stream=False, cache_dir=None, latency=False, schedule_format="csv",
+                     profile=False):
+    try:
+        if stream:
+            return path, stream_trace(path, variants, schedule_dir, latency, schedule_format, profile), None
+        return path, simulate_trace(path, variants, schedule_dir, cache_dir, latency, schedule_format, profile), None
+    except (OSError, ValueError) as e:
+        return path, [], e
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m simulate",
+        description="Run scheduling algorithms over CSV or JSON Lines traces without the GUI.",
+    )
+    parser.add_argument("traces", nargs="+", help="trace files (.csv, .jsonl)")
+    parser.add_argument("-a", "--algorithms", nargs="+", choices=list(ALGORITHM_NAMES), default=list(ALGORITHM_NAMES),
+                        help="algorithms to run (default: all)")
+    parser.add_argument("-q", "--quantum", nargs="+", type=float, default=[2.0],
+                        help="time quanta for Round Robin, MLFQ and Stride (default: 2)")
+    parser.add_argument("-o", "--output", default="-", help="metrics output file (default: stdout)")
+    parser.add_argument("-f", "--format", choices=["jsonl", "csv"], default="jsonl", help="metrics output format")
+    parser.add_argument("-s", "--schedules", metavar="DIR", help="also write one schedule file per trace and algorithm")
+    parser.add_argument("--schedule-format", choices=list(SCHEDULE_EXTENSIONS), default="csv",
+                        help="schedule file format: csv, or memory-mappable binary .sched files (default: csv)")
+    parser.add_argument("--stream", action="store_true",
+                        help="replay arrival-ordered traces lazily in constant memory instead of loading them")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="reuse simulation results stored in DIR for unchanged traces (not with -s, which "
+                             "replays each schedule to write it)")
+    parser.add_argument("-m", "--metrics", action="store_true",
+                        help="add turnaround, waiting, response and slowdown percentiles, utilization and throughput")
+    parser.add_argument("-p", "--profile", action="store_true",
+                        help="add engine counters, ready-queue lengths and input/engine/consumer timings")
+    parser.add_argument("-j", "--jobs", type=int, default=1, help="number of traces simulated in parallel")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    variants = comparison_variants([ALGORITHM_NAMES[name] for name in args.algorithms], args.quantum)
+    if args.schedules:
+        os.makedirs(args.schedules, exist_ok=True)
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    writer = None
+    if args.format == "csv":
+        writer = csv.DictWriter(output, fieldnames=RESULT_FIELDS + (LATENCY_FIELDS if args.metrics else [])
+                                + (PROFILE_FIELDS if args.profile else []))
+        writer.writeheader()
+
+    status = 0
+    executor = ProcessPoolExecutor(max_workers=args.jobs) if args.jobs > 1 else None
+    try:
+        mapper = executor.map if executor else map
+        for path, rows, error in mapper(_simulate_safely, args.traces, repeat(variants), repeat(args.schedules),
+                                         repeat(args.stream), repeat(args.cache_dir), repeat(args.metrics),
+                                         repeat(args.schedule_format), repeat(args.profile)):
+            if error is not None:
+                print(f"simulate: {path}: {error}", file=sys.stderr)
+                status = 1
+            for row in rows:
+                if writer:
+                    writer.writerow(row)
+                else:
+                    output.write(json.dumps(row) + "\n")
+    finally:
+        if executor:
+            executor.shutdown()
+        if output is not sys.stdout:
+            output.close()
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+
+from algorithms import round_robin_segments
+from compare import PARALLEL_MIN_JOBS, summarize_segments
+from workload import Workload
+
+SweepPoint = namedtuple(
+    "SweepPoint",
+    ["arrival_scale", "time_quantum", "average_waiting_time", "average_turnaround_time", "context_switches",
+     "total_time"],
+)
+
+_sweep_workload = None
+_sweep_jobs = {}
+
+
+def _init_sweep(workload):
+    global _sweep_workload
+    _sweep_workload = workload
+    _sweep_jobs.clear()
+
+
+def _jobs_at_scale(workload, jobs_by_scale, arrival_scale):
+    # Sorted job lists are shared by every quantum evaluated at the same arrival scale.
+    if arrival_scale not in jobs_by_scale:
+        scaled = Workload(workload.names, workload.name_ids, workload.arrival / arrival_scale,
+                          workload.burst, workload.priority)
+        jobs_by_scale[arrival_scale] = scaled.sorted_by_arrival().to_processes()
+    return jobs_by_scale[arrival_scale]
+
+
+def _evaluate(workload, jobs_by_scale, arrival_scale, time_quantum):
+    segments = round_robin_segments(_jobs_at_scale(workload, jobs_by_scale, arrival_scale), time_quantum)
+    result = summarize_segments("Round Robin", "Round Robin", time_quantum, segments)
+    return SweepPoint(arrival_scale, time_quantum, result.average_waiting_time, result.average_turnaround_time,
+                      result.context_switches, result.total_time)
+
+
+def _evaluate_in_worker(arrival_scale, time_quantum):
+    return _evaluate(_sweep_workload, _sweep_jobs, arrival_scale, time_quantum)
+
+
+def sweep_round_robin(processes, time_quanta, arrival_scales=(1.0,), max_workers=None, progress=None):
+    """Evaluate Round Robin over every (arrival_scale, time_quantum) pair.
+
+    An arrival scale multiplies the arrival rate, so 2.0 compresses arrivals into half the time.
+    Each worker receives the workload once and reuses its sorted job list across quanta.
+    """
+    workload = processes if isinstance(processes, Workload) else Workload.from_processes(processes)
+    points = list(product(arrival_scales, time_quanta))
+    if progress:
+        progress(0, len(points))
+
+    if max_workers == 1 or len(points) <= 1 or len(workload) < PARALLEL_MIN_JOBS:
+        jobs_by_scale = {}
+        results = []
+        for point in points:
+            results.append(_evaluate(workload, jobs_by_scale, *point))
+            if progress:
+                progress(len(results), len(points))
+        return results
+
+    # Spawned, not forked: the GUI runs sweeps from a pool thread of a multi-threaded Qt process.
+    executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"),
+                                   initializer=_init_sweep, initargs=(workload,))
+    try:
+        futures = {executor.submit(_evaluate_in_worker, *point): point for point in points}
+        results = {}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+            if progress:
+                progress(len(results), len(points))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    return [results[point] for point in points]
@@ -0,0 +1,50 @@
+import numpy as np
+
+from workload import Workload
+
+BURST_DISTRIBUTIONS = ("exponential", "pareto", "lognormal", "uniform")
+PRIORITY_DISTRIBUTIONS = ("uniform", "zipf", "constant")
+
+
+def poisson_arrivals(rng, count, rate):
+    return np.cumsum(rng.exponential(1.0 / rate, count))
+
+
+def burst_times(rng, count, distribution="exponential", mean=1.0):
+    if distribution == "exponential":
+        bursts = rng.exponential(mean, count)
+    elif distribution == "pareto":
+        shape = 1.5  # heavy tail with a finite mean
+        bursts = (rng.pareto(shape, count) + 1) * mean * (shape - 1) / shape
+    elif distribution == "lognormal":
+        sigma = 1.0
+        bursts = rng.lognormal(np.log(mean) - sigma ** 2 / 2, sigma, count)
+    elif distribution == "uniform":
+        bursts = rng.uniform(0, 2 * mean, count)
+    else:
+        raise ValueError(f"Unknown burst distribution: {distribution}")
+    return np.round(np.maximum(bursts, 0.01), 2)
+
+
+def priorities(rng, count, distribution="uniform", levels=8):
+    if distribution == "uniform":
+        return rng.integers(0, levels, count, dtype=np.int32)
+    if distribution == "zipf":
+        return (np.minimum(rng.zipf(2.0, count), levels) - 1).astype(np.int32)
+    if distribution == "constant":
+        return np.zeros(count, dtype=np.int32)
+    raise ValueError(f"Unknown priority distribution: {distribution}")
+
+
+def generate_workload(count, seed=0, arrival_rate=1.0, burst="exponential", mean_burst=0.9,
+                      priority="uniform", priority_levels=8):
+    """Seeded synthetic workload: Poisson arrivals, the chosen burst and priority distributions."""
+    rng = np.random.default_rng(seed)
+    arrival = np.round(poisson_arrivals(rng, count, arrival_rate), 2)
+    return Workload(
+        [f"p{i}" for i in range(count)],
+        np.arange(count, dtype=np.int32),
+        arrival,
+        burst_times(rng, count, burst, mean_burst),
+        priorities(rng, count, priority, priority_levels),
+    )
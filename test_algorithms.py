@@ -0,0 +1,246 @@
+import random
+from collections import deque
+from fractions import Fraction
+
+import pytest
+
+from algorithms import aging_priority_scheduling, fcfs, hrrn, mlfq, priority_scheduling, round_robin, srtf, stride
+
+
+def random_processes(rng, count, scale=1):
+    return [(f"P{i}", rng.randint(0, 30) / scale, rng.randint(1, 12) / scale, rng.randint(0, 4))
+            for i in range(count)]
+
+
+def exact(value):
+    return Fraction(value).limit_denominator(1000)
+
+
+def reference_round_robin(processes, time_quantum):
+    """Arrival-aware Round Robin in exact arithmetic, one quantum at a time."""
+    jobs = deque(sorted(((name, exact(arrival), exact(burst)) for name, arrival, burst, _ in processes),
+                        key=lambda job: job[1]))
+    time_quantum = Fraction(time_quantum)
+    queue = deque()
+    current_time = Fraction(0)
+    completion_times = {}
+    while jobs or queue:
+        while jobs and jobs[0][1] <= current_time:
+            name, _, burst = jobs.popleft()
+            queue.append([name, burst])
+        if not queue:
+            current_time = jobs[0][1]
+            continue
+        entry = queue.popleft()
+        slice_time = min(entry[1], time_quantum)
+        current_time += slice_time
+        entry[1] -= slice_time
+        while jobs and jobs[0][1] <= current_time:
+            name, _, burst = jobs.popleft()
+            queue.append([name, burst])
+        if entry[1]:
+            queue.append(entry)
+        else:
+            completion_times[entry[0]] = current_time
+    return completion_times
+
+
+def reference_fcfs(processes):
+    """The original list-based FCFS, kept as the reference for the event-driven engine."""
+    processes = sorted(processes, key=lambda x: x[1])
+    current_time = 0
+    schedule = []
+    timestamps = []
+    completion_times = {}
+    for process, arrival_time, cpu_burst, _ in processes:
+        start_time = max(current_time, arrival_time)
+        timestamps.append(start_time)
+        schedule.append((process, cpu_burst))
+        current_time = start_time + cpu_burst
+        completion_times[process] = current_time
+    timestamps.append(current_time)
+    return schedule, timestamps, completion_times
+
+
+def reference_preemptive(processes, column):
+    """The original list-based SRTF (column 2) / Priority Scheduling (column 3), re-sorting the queue each step."""
+    remaining_processes = sorted(processes, key=lambda x: x[1])
+    current_time = 0
+    schedule = []
+    timestamps = []
+    completion_times = {}
+    waiting_queue = []
+    while remaining_processes or waiting_queue:
+        while remaining_processes and remaining_processes[0][1] <= current_time:
+            waiting_queue.append(list(remaining_processes.pop(0)))
+        if waiting_queue:
+            waiting_queue.sort(key=lambda x: x[column])
+            job = waiting_queue.pop(0)
+            timestamps.append(current_time)
+            next_arrival_time = remaining_processes[0][1] if remaining_processes else float('inf')
+            time_to_next_arrival = next_arrival_time - current_time
+            if job[2] <= time_to_next_arrival:
+                schedule.append((job[0], job[2]))
+                current_time += job[2]
+                completion_times[job[0]] = current_time
+            else:
+                schedule.append((job[0], time_to_next_arrival))
+                job[2] -= time_to_next_arrival
+                current_time += time_to_next_arrival
+                waiting_queue.append(job)
+        elif current_time != remaining_processes[0][1]:
+            schedule.append(("Idle", remaining_processes[0][1] - current_time))
+            current_time = remaining_processes[0][1]
+            timestamps.append(current_time)
+    timestamps.append(current_time)
+    return schedule, timestamps, completion_times
+
+
+REFERENCES = {
+    "fcfs": (fcfs, reference_fcfs),
+    "srtf": (srtf, lambda processes: reference_preemptive(processes, 2)),
+    "priority": (priority_scheduling, lambda processes: reference_preemptive(processes, 3)),
+}
+
+
+@pytest.mark.parametrize("algorithm", REFERENCES)
+def test_matches_list_based_reference(algorithm):
+    # Integer times are exact, so schedules must match segment for segment, ties included.
+    run, reference = REFERENCES[algorithm]
+    rng = random.Random(algorithm)
+    for _ in range(500):
+        processes = random_processes(rng, rng.randint(1, 10))
+        schedule, timestamps, completion_times, waiting_times = run(list(processes))
+        assert (schedule, timestamps, completion_times) == reference(processes), processes
+        arrivals = {name: arrival for name, arrival, _, _ in processes}
+        bursts = {name: burst for name, _, burst, _ in processes}
+        assert dict(waiting_times) == {name: completion_times[name] - bursts[name] - arrivals[name]
+                                       for name in completion_times}
+
+
+def test_preemptive_engines_skip_float_residue_slices():
+    processes = [("P4", 0.3, 0.7, 4), ("P2", 0.5, 0.9, 0), ("P1", 1.0, 1.2, 4), ("P3", 1.0, 0.2, 3),
+                 ("P0", 1.6, 0.4, 1)]
+    for run in (srtf, priority_scheduling):
+        schedule = run(list(processes))[0]
+        assert min(duration for _, duration in schedule) > 1e-6, schedule
+
+
+def reference_hrrn(processes):
+    """HRRN by scanning every waiting job at each dispatch; ties go to the earliest arrival, then input order."""
+    pending = sorted(processes, key=lambda x: x[1])
+    waiting = []
+    current_time = 0
+    order = []
+    while pending or waiting:
+        while pending and pending[0][1] <= current_time:
+            waiting.append(pending.pop(0))
+        if not waiting:
+            current_time = pending[0][1]
+            continue
+        job = max(waiting, key=lambda job: ((current_time - job[1] + job[2]) / job[2] if job[2] > 0 else float('inf'),
+                                            -job[1], -waiting.index(job)))
+        waiting.remove(job)
+        order.append(job[0])
+        current_time += job[2]
+    return order
+
+
+@pytest.mark.parametrize("scale", [1, 10])
+def test_hrrn_matches_full_scan(scale):
+    rng = random.Random(scale)
+    for _ in range(300):
+        processes = random_processes(rng, rng.randint(1, 40), scale)
+        order = [process for process, _ in hrrn(list(processes))[0] if process != "Idle"]
+        assert order == reference_hrrn(processes), processes
+
+
+def test_aging_skips_float_residue_slices():
+    processes = [("P0", 0.2, 0.7, 2), ("P1", 4.9, 0.3, 1), ("P2", 1.8, 1.5, 1), ("P3", 1.2, 0.6, 1), ("P4", 0.7, 3.2, 2)]
+    schedule = aging_priority_scheduling(processes)[0]
+    assert min(duration for _, duration in schedule) > 1e-6, schedule
+
+
+def test_aging_switches_only_on_boundaries_or_for_better_arrivals():
+    schedule = aging_priority_scheduling([("A", 0, 20, 1), ("B", 0, 20, 1), ("C", 3, 1, 5)])[0]
+    assert schedule[:3] == [("A", 3), ("A", 7), ("B", 10)]
+    schedule = aging_priority_scheduling([("A", 0, 20, 3), ("B", 0, 20, 3), ("C", 3, 1, 1)])[0]
+    assert schedule[:2] == [("A", 3), ("C", 1)]
+
+
+def assert_same_completions(actual, expected):
+    assert actual.keys() == expected.keys()
+    for name, completion_time in expected.items():
+        assert actual[name] == pytest.approx(float(completion_time), abs=1e-6), name
+
+
+def test_round_robin_stops_at_arrival_on_fractional_quantum_boundary():
+    schedule, timestamps, completion_times, _ = round_robin([("A", 0.7, 1.5, 0), ("B", 1.1, 0.3, 0)], 0.1)
+    assert schedule[1][0] == "A" and schedule[1][1] == pytest.approx(0.4)
+    assert timestamps[2] == 1.1
+    assert completion_times["B"] == pytest.approx(1.6)
+
+
+@pytest.mark.parametrize("time_quantum", ["0.1", "0.2", "0.3", "0.7", "2"])
+def test_round_robin_matches_exact_reference(time_quantum):
+    rng = random.Random(time_quantum)
+    for _ in range(300):
+        processes = random_processes(rng, rng.randint(1, 10), scale=10)
+        expected = reference_round_robin(processes, Fraction(time_quantum))
+        assert_same_completions(round_robin(list(processes), float(time_quantum))[2], expected)
+
+
+def scaled(processes, factor):
+    return [(name, arrival * factor, burst * factor, priority) for name, arrival, burst, priority in processes]
+
+
+# Each engine runs with every time parameter multiplied by scale.
+QUANTUM_ENGINES = {
+    "stride": lambda processes, time_quantum, scale: stride(processes, time_quantum * scale),
+    "mlfq": lambda processes, time_quantum, scale: mlfq(processes, time_quantum * scale, 3, None),
+    "mlfq-single-level": lambda processes, time_quantum, scale: mlfq(processes, time_quantum * scale, 1, None),
+    "mlfq-boost": lambda processes, time_quantum, scale: mlfq(processes, time_quantum * scale, 3, 5 * scale),
+    "aging": lambda processes, time_quantum, scale: aging_priority_scheduling(processes, time_quantum * scale),
+    "aging-default": lambda processes, time_quantum, scale: aging_priority_scheduling(processes, 10 * scale),
+}
+
+
+@pytest.mark.parametrize("engine", QUANTUM_ENGINES)
+def test_fractional_quantum_matches_integer_time_scale(engine):
+    # Integer times and quanta are exact, so they are the reference for the same workload in tenths.
+    run = QUANTUM_ENGINES[engine]
+    rng = random.Random(engine)
+    for time_quantum in (1, 2, 3, 7):
+        for _ in range(200):
+            processes = random_processes(rng, rng.randint(1, 10))
+            expected = run(list(processes), time_quantum, 1)[2]
+            actual = run(scaled(processes, 0.1), time_quantum, 0.1)[2]
+            assert actual.keys() == expected.keys()
+            for name, completion_time in expected.items():
+                assert actual[name] == pytest.approx(completion_time / 10, abs=1e-6), (processes, name)
+
+
+@pytest.mark.parametrize("time_quantum", [1, 2, 3, 0.3, 0.7])
+def test_single_level_mlfq_is_round_robin(time_quantum):
+    assert [process for process, _ in mlfq([("A", 0, 5, 0), ("B", 1, 5, 0)], 2, 1, None)[0]] == ["A", "B"] * 3
+    rng = random.Random(str(time_quantum))
+    for _ in range(300):
+        processes = random_processes(rng, rng.randint(1, 10), rng.choice([1, 10]))
+        expected = round_robin(list(processes), time_quantum)[2]
+        assert_same_completions(mlfq(list(processes), time_quantum, 1, None)[2], expected)
+
+
+@pytest.mark.parametrize("boost_interval", [-5, -0.1, float("nan")])
+def test_mlfq_rejects_non_positive_boost_interval(boost_interval):
+    with pytest.raises(ValueError):
+        mlfq([("A", 0, 5, 0)], 2, 3, boost_interval)
+
+
+@pytest.mark.parametrize("boost_interval", [None, 0])
+def test_mlfq_boost_can_be_disabled(boost_interval):
+    assert mlfq([("A", 0, 5, 0), ("B", 1, 5, 0)], 2, 3, boost_interval)[2] == {"A": 7, "B": 10}
+
+
+def test_stride_stops_at_fractional_quantum_arrival():
+    schedule = stride([("A", 0.7, 1.5, 0), ("B", 1.1, 0.3, 0)], 0.1)[0]
+    assert schedule[1][0] == "A" and schedule[1][1] == pytest.approx(0.4)
@@ -0,0 +1,15 @@
+import pytest
+
+from compare import compare_algorithms, stream_algorithm, summarize_segments
+
+LATE_START = [("A", 3, 2, 0), ("B", 4, 1, 0), ("C", 9, 2, 0)]
+
+
+def test_total_time_starts_at_the_first_job_for_every_algorithm():
+    results = compare_algorithms(list(LATE_START), time_quanta=[2], max_workers=1)
+    totals = {result.algorithm: result.total_time for result in results}
+    assert totals["Round Robin"] == totals["FCFS"] == totals["SRTF"] == 8
+    for result in results:
+        streamed = summarize_segments(result.label, result.algorithm, result.time_quantum,
+                                      stream_algorithm(iter(LATE_START), result.algorithm, result.time_quantum))
+        assert result.total_time == pytest.approx(streamed.total_time), result.algorithm
@@ -0,0 +1,11 @@
+from instrumentation import profile_algorithm
+
+
+def test_arrival_splits_are_not_dispatches_or_preemptions():
+    report = profile_algorithm([("A", 0, 10, 0), ("B", 1, 20, 1), ("C", 2, 30, 2), ("D", 3, 40, 3)], "SRTF").report()
+    assert (report["dispatches"], report["preemptions"], report["completions"]) == (4, 0, 4)
+
+
+def test_preemption_counts_the_job_that_loses_the_cpu():
+    report = profile_algorithm([("A", 0, 10, 0), ("B", 1, 2, 1)], "SRTF").report()
+    assert (report["dispatches"], report["preemptions"], report["completions"]) == (3, 1, 2)
@@ -0,0 +1,68 @@
+import numpy as np
+import pytest
+
+from algorithms import srtf, srtf_segments
+from metrics import PERCENTILES, LatencyHistogram, ScheduleMetrics, schedule_metrics
+from multicore import simulate_multicore
+from synthetic import generate_workload
+
+
+@pytest.mark.parametrize("relative_accuracy", [0.01, 0.05])
+def test_histogram_quantiles_within_relative_accuracy(relative_accuracy):
+    values = np.random.default_rng(0).lognormal(0, 2, 20000)
+    values[:500] = 0.0
+    histogram = LatencyHistogram(relative_accuracy)
+    for value in values.tolist():
+        histogram.add(value)
+    for percentile in PERCENTILES:
+        expected = np.percentile(values, percentile, method="lower")
+        assert histogram.quantile(percentile / 100) == pytest.approx(expected, rel=relative_accuracy)
+    assert histogram.max == values.max()
+    assert histogram.mean() == pytest.approx(values.mean())
+
+
+def exact_latencies(processes, completion_times, first_starts):
+    latencies = {"turnaround": [], "waiting": [], "response": [], "slowdown": []}
+    for name, arrival, burst, _ in processes:
+        turnaround = completion_times[name] - arrival
+        latencies["turnaround"].append(turnaround)
+        latencies["waiting"].append(turnaround - burst)
+        latencies["response"].append(first_starts[name] - arrival)
+        latencies["slowdown"].append(turnaround / burst if burst > 0 else 1.0)
+    return latencies
+
+
+def test_schedule_metrics_match_exact_percentiles():
+    processes = sorted(generate_workload(5000, seed=1).to_processes(), key=lambda job: job[1])
+    first_starts = {}
+    metrics = ScheduleMetrics()
+    for job, start_time, _, _ in metrics.observe(srtf_segments(iter(processes))):
+        if job is not None:
+            first_starts.setdefault(job[0], start_time)
+    report = metrics.report()
+    completion_times = srtf(list(processes))[2]
+    assert report["jobs"] == len(processes)
+    for latency, values in exact_latencies(processes, completion_times, first_starts).items():
+        assert report[f"{latency}_mean"] == pytest.approx(np.mean(values))
+        assert report[f"{latency}_max"] == pytest.approx(max(values))
+        for percentile in PERCENTILES:
+            assert report[f"{latency}_p{percentile}"] == pytest.approx(
+                np.percentile(values, percentile, method="lower"), rel=0.01, abs=1e-9), (latency, percentile)
+
+
+def test_lane_replay_matches_the_segment_stream():
+    processes = [(f"P{i}", float(i // 2), float(1 + i % 5), i % 3) for i in range(40)]
+    metrics = ScheduleMetrics()
+    for _ in metrics.observe(srtf_segments(iter(processes))):
+        pass
+    assert schedule_metrics(processes, [srtf(list(processes))[:2]]) == pytest.approx(metrics.report())
+
+
+def test_multicore_lanes_count_every_job_once():
+    processes = [(f"P{i}", float(i), float(3 + i % 4), 0) for i in range(30)]
+    lanes, completion_times, _, _ = simulate_multicore(list(processes), "Round Robin", 3, "global", 2)
+    report = schedule_metrics(processes, lanes)
+    assert report["jobs"] == len(processes)
+    assert report["turnaround_max"] == pytest.approx(
+        max(completion_times[name] - arrival for name, arrival, _, _ in processes))
+    assert 0 < report["utilization"] <= 1
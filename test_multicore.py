@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from algorithms import fcfs, priority_scheduling, round_robin, srtf
+from multicore import MODES, simulate_multicore
+from test_algorithms import random_processes
+
+SINGLE_CORE = {
+    "FCFS": (fcfs, None),
+    "Round Robin": (round_robin, 2),
+    "SRTF": (srtf, None),
+    "Priority Scheduling": (priority_scheduling, None),
+}
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("algorithm", SINGLE_CORE)
+@pytest.mark.parametrize("scale", [1, 10])
+def test_one_core_matches_single_core_engine(algorithm, mode, scale):
+    run, time_quantum = SINGLE_CORE[algorithm]
+    rng = random.Random(f"{algorithm}-{mode}-{scale}")
+    for _ in range(300):
+        processes = random_processes(rng, rng.randint(1, 10), scale)
+        expected = (run(list(processes), time_quantum) if time_quantum else run(list(processes)))[2]
+        completion_times = simulate_multicore(list(processes), algorithm, 1, mode, time_quantum)[1]
+        assert completion_times.keys() == expected.keys()
+        for name, completion_time in expected.items():
+            assert completion_times[name] == pytest.approx(completion_time, abs=1e-6), (processes, name)
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_one_core_round_robin_matches_on_fractional_quantum(mode):
+    rng = random.Random(mode)
+    for _ in range(300):
+        processes = random_processes(rng, rng.randint(1, 10), scale=10)
+        expected = round_robin(list(processes), 0.3)[2]
+        completion_times = simulate_multicore(list(processes), "Round Robin", 1, mode, 0.3)[1]
+        for name, completion_time in expected.items():
+            assert completion_times[name] == pytest.approx(completion_time, abs=1e-6), (processes, name)
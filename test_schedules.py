@@ -0,0 +1,30 @@
+import pytest
+
+from algorithms import srtf_segments
+from multicore import simulate_multicore
+from schedules import ScheduleFile, ScheduleWriter, write_schedule_file
+
+PROCESSES = [("A", 0, 2.123, 0), ("B", 5, 3, 0), ("C", 5.5, 1, 1), ("D", 6, 0.25, 2)]
+
+
+def test_writer_round_trips_exact_segments(tmp_path):
+    path = tmp_path / "srtf.sched"
+    with ScheduleWriter(path) as writer:
+        segments = list(writer.observe(srtf_segments(iter(PROCESSES))))
+    schedule_file = ScheduleFile(path)
+    assert len(schedule_file) == len(segments)
+    assert [schedule_file.process_name(process) for process in schedule_file.process.tolist()] == \
+        ["Idle" if job is None else job[0] for job, _, _, _ in segments]
+    assert schedule_file.start.tolist() == [start_time for _, start_time, _, _ in segments]
+    assert schedule_file.duration.tolist() == [duration for _, _, duration, _ in segments]
+    [(schedule, timestamps)] = schedule_file.to_lanes()
+    assert schedule == [("Idle" if job is None else job[0], duration) for job, _, duration, _ in segments]
+    _, last_start, last_duration, _ = segments[-1]
+    assert timestamps == [round(start_time, 2) for _, start_time, _, _ in segments] + [last_start + last_duration]
+
+
+@pytest.mark.parametrize("mode", ["global", "partitioned"])
+def test_lanes_round_trip(tmp_path, mode):
+    lanes = simulate_multicore(list(PROCESSES), "Round Robin", 2, mode, 0.5)[0]
+    write_schedule_file(tmp_path / "lanes.sched", lanes)
+    assert ScheduleFile(tmp_path / "lanes.sched").to_lanes() == lanes
@@ -0,0 +1,19 @@
+import random
+
+import pytest
+
+from compare import comparison_variants
+from simulate import ALGORITHM_NAMES, simulate_trace
+
+
+def test_writing_schedules_gives_the_same_rows(tmp_path):
+    rng = random.Random(0)
+    trace = tmp_path / "trace.csv"
+    trace.write_text("name,arrival,burst,priority\n" + "".join(
+        f"P{i},{rng.randint(0, 400) / 10},{rng.randint(1, 40) / 10},{rng.randint(0, 4)}\n" for i in range(200)))
+    variants = comparison_variants(list(ALGORITHM_NAMES.values()), [2, 0.5])
+    expected = simulate_trace(str(trace), variants, latency=True)
+    rows = simulate_trace(str(trace), variants, str(tmp_path), latency=True)
+    assert len(list(tmp_path.glob("trace.*.csv"))) == len(variants)
+    for row, expected_row in zip(rows, expected):
+        assert row == pytest.approx(expected_row), row["label"]
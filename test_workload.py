@@ -0,0 +1,42 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from algorithms import fcfs
+from test_algorithms import random_processes
+from workload import Workload, job_metrics
+
+
+@pytest.mark.parametrize("scale", [1, 10])
+def test_columnar_fcfs_matches_list_fcfs(scale):
+    rng = random.Random(scale)
+    for _ in range(300):
+        processes = random_processes(rng, rng.randint(1, 20), scale)
+        schedule, timestamps, completion_times, waiting_times = fcfs(Workload.from_processes(processes))
+        expected = fcfs(list(processes))
+        assert schedule == expected[0]
+        assert timestamps == pytest.approx(expected[1])
+        assert completion_times == pytest.approx(expected[2])
+        assert dict(waiting_times) == pytest.approx(dict(expected[3]))
+
+
+def test_align_maps_names_onto_rows():
+    workload = Workload.from_processes([("A", 0, 1, 0), ("B", 1, 2, 0), ("A", 2, 3, 0), ("C", 3, 1, 0)])
+    aligned = workload.align({"A": 5.0, "B": 7.0})
+    assert aligned[:3].tolist() == [5.0, 7.0, 5.0]
+    assert math.isnan(aligned[3])
+    assert workload.align({}, default=0.0).tolist() == [0.0] * 4
+
+
+def test_job_metrics_match_per_job_arithmetic():
+    rng = random.Random(0)
+    processes = random_processes(rng, 50, 10)
+    workload = Workload.from_processes(processes)
+    completion_times = fcfs(list(processes))[2]
+    metrics = job_metrics(workload, workload.align(completion_times))
+    assert metrics["turnaround"] == pytest.approx(
+        np.array([completion_times[name] - arrival for name, arrival, _, _ in processes]))
+    assert metrics["waiting"] == pytest.approx(
+        np.array([completion_times[name] - arrival - burst for name, arrival, burst, _ in processes]))
@@ -0,0 +1,78 @@
+import csv
+import json
+import os
+
+from workload import Workload
+
+COLUMN_ALIASES = {
+    "process": "name",
+    "name": "name",
+    "arrival": "arrival",
+    "arrival_time": "arrival",
+    "burst": "burst",
+    "cpu_burst": "burst",
+    "burst_time": "burst",
+    "priority": "priority",
+}
+
+
+def _job(name, arrival, burst, priority):
+    # Missing CSV fields come back as None and JSON values can be lists or objects; both are bad rows.
+    try:
+        return str(name), float(arrival or 0.0), float(burst), int(priority) if priority not in (None, "") else 0
+    except TypeError:
+        raise ValueError(f"Trace row {name!r} has a missing or non-numeric value") from None
+
+
+def _normalize(record):
+    fields = {}
+    for key, value in record.items():
+        if key is None:  # values beyond the CSV header
+            continue
+        column = COLUMN_ALIASES.get(key.strip().lower().replace(" ", "_"))
+        if column:
+            fields[column] = value
+    for column in ("name", "burst"):
+        if column not in fields:
+            raise ValueError(f"Trace row is missing a '{column}' column")
+    return _job(fields["name"], fields.get("arrival"), fields["burst"], fields.get("priority"))
+
+
+def _iter_csv(file):
+    for record in csv.DictReader(file):
+        yield _normalize(record)
+
+
+def _iter_jsonl(file):
+    for line in file:
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        if isinstance(record, dict):
+            yield _normalize(record)
+        elif isinstance(record, list) and len(record) >= 3:
+            name, arrival, burst, *rest = record
+            yield _job(name, arrival, burst, rest[0] if rest else None)
+        else:
+            raise ValueError(f"Trace line is not a job record: {line}")
+
+
+def trace_format(path):
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        return "csv"
+    if extension in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    raise ValueError(f"Unsupported trace format: {path}")
+
+
+def iter_jobs(path):
+    """Yield (name, arrival, burst, priority) tuples from a CSV or JSON Lines trace, one row at a time."""
+    reader = _iter_csv if trace_format(path) == "csv" else _iter_jsonl
+    with open(path, newline="") as file:
+        yield from reader(file)
+
+
+def load_workload(path):
+    return Workload.from_processes(iter_jobs(path))
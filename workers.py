@@ -0,0 +1,52 @@
+import threading
+from concurrent.futures import CancelledError
+
+from PySide6.QtCore import QObject, QRunnable, Signal, Slot
+
+
+class WorkerSignals(QObject):
+    progress = Signal(int, int)
+    result = Signal(object)
+    error = Signal(str)
+    finished = Signal()
+
+
+class Worker(QRunnable):
+    """Run fn(*args, progress=...) on a QThreadPool thread and report back through Qt signals.
+
+    The progress callback raises CancelledError once cancel() has been called, so long
+    jobs stop at their next progress report; a cancelled job never emits result.
+    """
+
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = WorkerSignals()
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def is_cancelled(self):
+        return self._cancelled.is_set()
+
+    def report_progress(self, done, total):
+        if self._cancelled.is_set():
+            raise CancelledError()
+        self.signals.progress.emit(done, total)
+
+    @Slot()
+    def run(self):
+        try:
+            result = self.fn(*self.args, progress=self.report_progress)
+        except CancelledError:
+            pass
+        except Exception as e:
+            if not self._cancelled.is_set():
+                self.signals.error.emit(str(e))
+        else:
+            if not self._cancelled.is_set():
+                self.signals.result.emit(result)
+        finally:
+            self.signals.finished.emit()
@@ -0,0 +1,69 @@
+import numpy as np
+
+
+class Workload:
+    """Columnar process table: one NumPy array per field plus an interned name table."""
+
+    __slots__ = ("names", "name_ids", "arrival", "burst", "priority")
+
+    def __init__(self, names, name_ids, arrival, burst, priority):
+        self.names = list(names)
+        self.name_ids = np.asarray(name_ids, dtype=np.int32)
+        self.arrival = np.asarray(arrival, dtype=np.float64)
+        self.burst = np.asarray(burst, dtype=np.float64)
+        self.priority = np.asarray(priority, dtype=np.int32)
+
+    @classmethod
+    def from_columns(cls, names, arrival, burst, priority=None):
+        table = {}
+        name_ids = np.fromiter((table.setdefault(name, len(table)) for name in names), dtype=np.int32)
+        if priority is None:
+            priority = np.zeros(len(name_ids), dtype=np.int32)
+        return cls(table, name_ids, arrival, burst, priority)
+
+    @classmethod
+    def from_processes(cls, processes):
+        processes = list(processes)
+        return cls.from_columns(
+            [p[0] for p in processes],
+            [p[1] for p in processes],
+            [p[2] for p in processes],
+            [p[3] if len(p) > 3 else 0 for p in processes],
+        )
+
+    def __len__(self):
+        return len(self.name_ids)
+
+    def __iter__(self):
+        return iter(self.to_processes())
+
+    def process_names(self):
+        return np.array(self.names, dtype=object)[self.name_ids]
+
+    def to_processes(self):
+        return list(zip(
+            self.process_names().tolist(),
+            self.arrival.tolist(),
+            self.burst.tolist(),
+            self.priority.tolist(),
+        ))
+
+    def take(self, rows):
+        return Workload(self.names, self.name_ids[rows], self.arrival[rows], self.burst[rows], self.priority[rows])
+
+    def sorted_by_arrival(self):
+        return self.take(np.argsort(self.arrival, kind="stable"))
+
+    def align(self, values, default=np.nan):
+        """Map a per-name dict (e.g. completion_times) onto this workload's rows."""
+        by_id = np.array([values.get(name, default) for name in self.names], dtype=np.float64)
+        return by_id[self.name_ids]
+
+
+def job_metrics(workload, completion):
+    """Per-row turnaround and waiting times for completion times aligned with the workload's rows."""
+    turnaround = completion - workload.arrival
+    return {
+        "turnaround": turnaround,
+        "waiting": turnaround - workload.burst,
+    }